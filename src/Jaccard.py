@@ -9,7 +9,7 @@
 #   Jaccard index as a function of nodes included.
 #
 # Status: Complete
-# Version: 2.0
+# Version: 2.3
 # Language: Python
 # Changelog:
 #    + 2013-01-08: Created
@@ -18,16 +18,26 @@
 #    + 2013-01-14: Modified to output the maximum Jaccard index too
 #    + 2013-01-14: Corrected Z-score (used to div by variance, now by stdev); 
 #                   incremented version number to 2.0
+#    + 2026-10-18: Replaced the list-shuffling null model with a blocked NumPy
+#                   permutation engine (online mean/variance, optional
+#                   process pool with reproducible per-block seeds)
+#    + 2026-10-18: Added --exact, which computes the null mean and variance
+#                   analytically instead of by simulation
+#    + 2026-10-18: Added --edges, which ranks two weighted edgelists directly
+#                   and produces edgewise (.eja) output
+#    + 2026-10-18: --exact sums only the likely values of X and I, by FFT, so
+#                   that it scales to edgewise analyses
+#    + 2026-10-18: Null variances within rounding error of zero give NaN Z
 
 # Calculate the jaccard index of two sets of nodes
 
 import sys
 import math
-import random
-import scipy.stats
-
-def usage():
-	sys.stderr.write("Usage: jaccardNode [Ordered node file1] [Ordered node file 2]\n")
+import argparse
+import multiprocessing
+import numpy as np
+import scipy.special
+import edgelistIO
 	
 def errorOut(message, code):
 	sys.stderr.write("Error: %s" % message)
@@ -36,6 +46,52 @@ def errorOut(message, code):
 def readNodeList(path):
 	return [ line.strip().split('\t')[0] for line in open(path) ]
 
+# Reads a weighted edgelist (text or binary) into arrays of node names and
+#  weights
+def readWeightedEdges(path):
+	el = edgelistIO.readEdgelist(path)
+	return el.nodes[el.src], el.nodes[el.dst], np.asarray(el.weight)
+
+# Canonicalizes the unordered edges of two weighted edgelists to 64-bit keys
+#  (lo*nNodes + hi, over node IDs shared by both networks) and ranks each
+#  network's edges by decreasing weight.  Repeated edges keep their last
+#  weight, as in networkx; ties keep file order.
+def rankEdgeKeys(edges1, edges2):
+	nodes, inverse = np.unique(np.concatenate([edges1[0], edges1[1], edges2[0], edges2[1]]), return_inverse=True)
+	nNodes = len(nodes)
+	inverse = inverse.astype(np.int64)
+
+	ranked = []
+	offset = 0
+	for u, v, weight in (edges1, edges2):
+		nEdges = len(weight)
+		uid = inverse[offset:offset+nEdges]
+		vid = inverse[offset+nEdges:offset+2*nEdges]
+		offset += 2*nEdges
+
+		keys = np.minimum(uid, vid)*nNodes + np.maximum(uid, vid)
+
+		# Index of the last occurrence of every key, in file order
+		last = np.sort(nEdges - 1 - np.unique(keys[::-1], return_index=True)[1])
+		order = last[np.argsort(-weight[last], kind='mergesort')]
+		ranked.append(keys[order])
+
+	return ranked[0], ranked[1]
+
+# Encodes two ranked key arrays as integer IDs.  Keys found in both arrays
+#  are numbered 0..nShared-1; the others all receive the ID nShared, which
+#  serves as a sink that can never contribute to the intersection.
+def encodeKeys(keys1, keys2):
+	shared = np.intersect1d(keys1, keys2)
+	nShared = len(shared)
+
+	encoded = []
+	for keys in (keys1, keys2):
+		ids = np.searchsorted(shared, keys)
+		encoded.append(np.where(np.in1d(keys, shared), ids, nShared).astype(np.int64))
+
+	return encoded[0], encoded[1], nShared
+
 # Calculate the jaccard index of two lists for minNode number of increasing
 #  thresholds.
 def jaccard(list1, list2, minNodes):
@@ -62,59 +118,298 @@ def jaccard(list1, list2, minNodes):
 		jArr.append(J)
 	return jArr
 	
-# Calculates the mean and stdev of jaccard scores
-#  Warning: Destroys the ordering of each list.
-def rndJaccard(list1, list2, minNodes, numTrials):
-	# Perform shuffles and recalculations
-	allJArr = []
-	for i in xrange(numTrials):
-		# Shuffle the lists
-		random.shuffle(list1)
-		random.shuffle(list2)
+# Calculates the Jaccard index at every threshold for a block of orderings,
+#  given the (trials x nShared) threshold at which each shared item is in
+#  both prefixes.  The running intersection is a cumulative sum of these
+#  arrivals and the union follows as 2k - intersection.
+def arrivalJaccard(arrival, minNodes):
+	numTrials = arrival.shape[0]
+	rows = np.arange(numTrials)[:, np.newaxis]
 		
-		# Calculate a Jaccard score
-		jArr = jaccard(list1, list2, minNodes)
-		allJArr.append(jArr)
+	arrived = arrival < minNodes
+	flatArrival = (rows * minNodes + arrival)[arrived]
 		
-	# Calculate statistics
-	trialSeries = [ [ jArr[i] for jArr in allJArr ] for i in xrange(len(allJArr[0])) ]
+	inter = np.bincount(flatArrival, minlength=numTrials*minNodes).reshape(numTrials, minNodes).cumsum(axis=1)
+	union = 2*np.arange(1, minNodes+1) - inter
+	return inter / union.astype(np.float64)
+
+# Calculates the Jaccard index at every threshold for orderings given as
+#  (trials x minNodes) arrays of encoded IDs.  A shared item arrives at the
+#  later of its two positions.
+def prefixJaccard(perm1, perm2, nShared):
+	numTrials, minNodes = perm1.shape
+	rows = np.arange(numTrials)[:, np.newaxis]
+	cols = np.arange(minNodes)
 	
-	trialStats = [ scipy.stats.describe(ser) for ser in trialSeries ]
+	pos1 = np.empty((numTrials, nShared + 1), dtype=np.int64)
+	pos2 = np.empty((numTrials, nShared + 1), dtype=np.int64)
+	pos1.fill(minNodes)
+	pos2.fill(minNodes)
+	pos1[rows, perm1] = cols
+	pos2[rows, perm2] = cols
 	
-	# Extract mean, standard deviation and n for return
-	retStats = [ (stat[2], stat[3], stat[0]) for stat in trialStats ]
-	return retStats
+	return arrivalJaccard(np.maximum(pos1[:, :nShared], pos2[:, :nShared]), minNodes)
+
+# Worker for a single block of random orderings.  Returns the number of
+#  trials and the per-threshold mean and sum of squared deviations.
+def rndJaccardBlock(task):
+	n1, n2, nShared, minNodes, numTrials, seed = task
+	rng = np.random.RandomState(seed)
+
+	# A shuffled row of 0..n-1 gives the random position of every list item
+	#  directly (the inverse of a uniform permutation is uniform).  Which
+	#  column stands for which item is arbitrary, so let the first nShared
+	#  columns of both lists hold the shared items, in ID order.
+	arrival = np.zeros((numTrials, nShared), dtype=np.int64)
+	for n in (n1, n2):
+		pos = np.tile(np.arange(n), (numTrials, 1))
+		for row in pos:
+			rng.shuffle(row)
+		np.maximum(arrival, pos[:, :nShared], out=arrival)
+
+	J = arrivalJaccard(arrival, minNodes)
+	mean = J.mean(axis=0)
+	return numTrials, mean, ((J - mean)**2).sum(axis=0)
+
+# Combines per-block statistics (Chan et al. parallel variance update)
+def mergeStats(stats, block):
+	n, mean, m2 = stats
+	nB, meanB, m2B = block
+
+	nTot = n + nB
+	delta = meanB - mean
+	mean = mean + delta*(nB / float(nTot))
+	m2 = m2 + m2B + delta*delta*(n*nB / float(nTot))
+	return nTot, mean, m2
+
+# Calculates the mean and variance of jaccard scores over numTrials random
+#  orderings of each list, generated in blocks of at most blockSize trials.
+#  Each block draws from its own seed (derived from seed), so results are
+#  reproducible regardless of the number of worker processes.
+def rndJaccard(list1, list2, minNodes, numTrials, blockSize=100, workers=1, seed=None):
+	nShared = len(set(list1).intersection(list2))
+	return rndJaccardSizes(len(list1), len(list2), nShared, minNodes, numTrials, blockSize, workers, seed)
+
+# As rndJaccard, given only the list lengths and the number of shared items
+#  (all that the null model depends on)
+def rndJaccardSizes(n1, n2, nShared, minNodes, numTrials, blockSize=100, workers=1, seed=None):
+	nBlocks = (numTrials + blockSize - 1) // blockSize
+	blockSeeds = np.random.RandomState(seed).randint(0, 2**31 - 1, size=nBlocks)
+	tasks = [ (n1, n2, nShared, minNodes, min(blockSize, numTrials - i*blockSize), blockSeeds[i]) for i in xrange(nBlocks) ]
+
+	if workers > 1:
+		pool = multiprocessing.Pool(workers)
+		blocks = pool.imap(rndJaccardBlock, tasks)
+	else:
+		pool = None
+		blocks = (rndJaccardBlock(task) for task in tasks)
+
+	stats = (0, np.zeros(minNodes), np.zeros(minNodes))
+	for block in blocks:
+		stats = mergeStats(stats, block)
+
+	if pool is not None:
+		pool.close()
+		pool.join()
+
+	# Extract mean, variance and n for return
+	n, mean, m2 = stats
+	var = m2 / (n - 1)
+	return [ (m, v, n) for m, v in zip(mean.tolist(), var.tolist()) ]
 	
+# Log of the binomial coefficient C(n, k) from a table of log-factorials
+def logChoose(logFact, n, k):
+	return logFact[n] - logFact[k] - logFact[n - k]
+
+# Log-probability that a hypergeometric variable (population N with K
+#  successes, n draws) takes each value of i
+def hypergeomLogPmf(logFact, N, K, n, i):
+	return logChoose(logFact, K, i) + logChoose(logFact, N - K, n - i) - logChoose(logFact, N, n)
+
+# Smallest and largest values of a hypergeometric variable whose probability
+#  is at least tol times that of the mode.  The pmf is log-concave, so both
+#  ends are found by bisection on either side of the mode.
+def hypergeomWindow(logFact, N, K, n, tol):
+	lo, hi = max(0, n - (N - K)), min(K, n)
+	mode = min(max((n + 1)*(K + 1) // (N + 2), lo), hi)
+	cutoff = hypergeomLogPmf(logFact, N, K, n, mode) + math.log(tol)
+
+	# First value at or above the cutoff in [lo, mode]
+	a, b = lo, mode
+	while a < b:
+		mid = (a + b) // 2
+		if hypergeomLogPmf(logFact, N, K, n, mid) >= cutoff:
+			b = mid
+		else:
+			a = mid + 1
+	left = a
+
+	# Last value at or above the cutoff in [mode, hi]
+	a, b = mode, hi
+	while a < b:
+		mid = (a + b + 1) // 2
+		if hypergeomLogPmf(logFact, N, K, n, mid) >= cutoff:
+			a = mid
+		else:
+			b = mid - 1
+	return left, a
+
+# Calculates the exact mean and variance of jaccard scores under random
+#  ordering of two lists of lengths n1 and n2 that share nShared items.
+#  With k items taken from each list, the number of shared items in the
+#  first prefix, X, is hypergeometric (n1, nShared, k).  Given X = x, the
+#  intersection I is hypergeometric (n2, x, k) since the second prefix is a
+#  random k-subset of the second list.  J = I / (2k - I).
+#
+#  Only values of X, and of I given X, within tol of the mode's probability
+#  are summed; the rest cannot change the result at double precision.  I is
+#  stochastically increasing in X, so the values of I needed for every
+#  retained x lie between the lower end of the window at the smallest x and
+#  the upper end at the largest.
+#
+#  log P(X = x, I = i) splits into terms of x, of i and of d = x - i, so
+#  P(I = i) is a correlation of the x and d terms, computed by FFT.  The
+#  terms are tilted by exp(theta*x) and exp(theta*d) (which cancel against
+#  exp(theta*i)) so that both peak where the joint distribution does and
+#  the FFT rounding stays far below the probabilities that matter.  The work
+#  per k grows with the spread of the distributions (about sqrt(k)), not
+#  with k.
+def exactJaccard(n1, n2, nShared, minNodes, tol=1e-18):
+	logFact = scipy.special.gammaln(np.arange(max(n1, n2) + 1) + 1.0)
+	logFactList = logFact.tolist()
+
+	retStats = []
+	for k in xrange(1, minNodes+1):
+		xLo, xHi = hypergeomWindow(logFactList, n1, nShared, k, tol)
+		iLo = hypergeomWindow(logFactList, n2, xLo, k, tol)[0]
+		iHi = hypergeomWindow(logFactList, n2, xHi, k, tol)[1]
+		x = np.arange(xLo, xHi + 1)
+		i = np.arange(iLo, iHi + 1)
+
+		# Terms of x (log P(X = x) included), of i and of d; d ranges over
+		#  xLo - iHi .. xHi - iLo and is impossible outside 0 .. n2 - k
+		logPX = hypergeomLogPmf(logFact, n1, nShared, k, x)
+		logX = logPX + logFact[x] + logFact[n2 - x]
+		logI = -logFact[i] - logFact[k - i]
+		d = np.arange(xLo - iHi, xHi - iLo + 1)
+		possible = (d >= 0) & (d <= n2 - k)
+		dSafe = np.where(possible, d, 0)
+		logD = np.where(possible, -logFact[dSafe] - logFact[n2 - k - dSafe], -np.inf)
+
+		# Tilt by the slope of the x terms at the most likely x
+		xMode = x[np.argmax(logPX)]
+		theta = math.log((xMode + 0.5) / (n2 - xMode + 0.5))
+		tiltedX = logX - theta*x
+		tiltedD = logD + theta*d
+		fX = np.exp(tiltedX - tiltedX.max())[::-1]
+		fD = np.exp(tiltedD - tiltedD[possible].max())
+
+		# sum over x of fX(x) fD(x - i), for i from iHi down to iLo
+		size = 1 << int(math.ceil(math.log(len(fX) + len(fD) - 1, 2)))
+		corr = np.fft.irfft(np.fft.rfft(fX, size) * np.fft.rfft(fD, size), size)[len(x)-1:len(x)+len(i)-1][::-1]
+
+		# Rounding can leave negative sums where P(I = i) is negligible
+		positive = corr > 0
+		logPI = np.full(len(i), -np.inf)
+		logPI[positive] = np.log(corr[positive]) + logI[positive] + theta*i[positive]
+		pI = np.exp(logPI - logPI.max())
+
+		J = i / (2.0*k - i)
+		mean = pI.dot(J) / pI.sum()
+		var = pI.dot((J - mean)**2) / pI.sum()
+		retStats.append((float(mean), float(var), None))
+
+	return retStats
+
 def maxJaccard(nUnion, minNodes):
 	return [ min(i, nUnion) / float( min(i, nUnion) + 2*max(0,i-nUnion) ) for i in xrange(1,minNodes+1) ]
 	
+# Z score of an observation; undefined (NaN) when the null has no variance,
+#  e.g. when both lists are exhausted and contain the same items.  Variances
+#  within rounding error of zero count as none: a simulated null whose
+#  trials all agree leaves residue of order 1e-30, while the smallest real
+#  variance of J (one trial in 1000 off by one item at a million items) is
+#  above 1e-16.
+def zScore(x, mean, var):
+	if var <= 1e-20 * max(mean*mean, 1):
+		return float('nan')
+	return (x - mean)/math.sqrt(var)
+	
+# Writes the six-column .nja/.eja table: threshold, observed J, null mean,
+#  null variance, Z score and maximum J
+def writeJaccardTable(out, J, rJ, maxJ):
+	lines = []
+	for index, dat in enumerate(zip(J, rJ, maxJ)):
+		z = zScore(dat[0], dat[1][0], dat[1][1])
+		lines.append("%d %s %s %s %s %s\n" % (index+1, dat[0], dat[1][0], dat[1][1], z, dat[2]))
+	out.write("".join(lines))
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Jaccard index of two ordered node lists as a function of nodes included")
+	parser.add_argument("list1", help="Ordered node file 1 (weighted edgelist with --edges)")
+	parser.add_argument("list2", help="Ordered node file 2 (weighted edgelist with --edges)")
+	parser.add_argument("--edges", action="store_true", help="Compare the edges of two weighted edgelists, ranked by weight")
+	parser.add_argument("--trials", type=int, default=1000, help="Number of random orderings in the null model (default: 1000)")
+	parser.add_argument("--block-size", type=int, default=100, help="Random orderings generated per block (default: 100)")
+	parser.add_argument("--workers", type=int, default=1, help="Number of processes used to evaluate blocks (default: 1)")
+	parser.add_argument("--seed", type=int, default=None, help="Seed for the random orderings")
+	parser.add_argument("--exact", action="store_true", help="Compute the null distribution analytically instead of by random orderings")
+	return parser.parse_args()
+
+# Edgewise analysis: ranks the edges of both networks by weight and
+#  compares them by their canonical keys
+def mainEdges(args):
+	keys1, keys2 = rankEdgeKeys(readWeightedEdges(args.list1), readWeightedEdges(args.list2))
+	ids1, ids2, nShared = encodeKeys(keys1, keys2)
+
+	minEdges = min(len(ids1), len(ids2))
+
+	# Calculate the Jaccard index
+	J = prefixJaccard(ids1[np.newaxis, :minEdges], ids2[np.newaxis, :minEdges], nShared)[0].tolist()
+
+	# Calculate scores due to random chance
+	if args.exact:
+		rJ = exactJaccard(len(ids1), len(ids2), nShared, minEdges)
+	else:
+		rJ = rndJaccardSizes(len(ids1), len(ids2), nShared, minEdges, args.trials, args.block_size, args.workers, args.seed)
+
+	# Get the maximum Jaccard index
+	maxJ = maxJaccard(nShared, minEdges)
+
+	writeJaccardTable(sys.stdout, J, rJ, maxJ)
+
 def main():
-	# Check arguments
-	if len(sys.argv) < 3:
-		usage()
-		errorOut("Not enough arguments", 255)
+	args = parseArgs()
+	if args.trials < 2:
+		errorOut("At least two trials are required\n", 255)
+
+	if args.edges:
+		mainEdges(args)
+		return
 		
 	#Node sets
-	list1 = readNodeList(sys.argv[1])
-	list2 = readNodeList(sys.argv[2])
+	list1 = readNodeList(args.list1)
+	list2 = readNodeList(args.list2)
 	
 	minNodes = min(len(list1), len(list2))
 	
 	# Calculate the Jaccard index
 	J = jaccard(list1, list2, minNodes)
 	
+	nInter = len(set(list1).intersection(set(list2)))
+	
 	# Calculate scores due to random chance
-	rJ = rndJaccard(list1, list2, minNodes, 1000)
+	if args.exact:
+		rJ = exactJaccard(len(list1), len(list2), nInter, minNodes)
+	else:
+		rJ = rndJaccard(list1, list2, minNodes, args.trials, args.block_size, args.workers, args.seed)
 	
 	# Get the maximum Jaccard index
-	nInter = len(set(list1).intersection(set(list2)))
 	maxJ = maxJaccard(nInter, minNodes)	
 	
 	# Combine data, calculate Z score and write to console
-	for index, dat in enumerate(zip(J, rJ, maxJ)):
-		z = (dat[0] - dat[1][0])/math.sqrt(dat[1][1])
-		print index+1, dat[0], dat[1][0], dat[1][1], z, dat[2]
+	writeJaccardTable(sys.stdout, J, rJ, maxJ)
 	
 	
-
-main()
\ No newline at end of file
+if __name__ == '__main__':
+	main()
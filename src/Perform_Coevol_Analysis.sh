@@ -22,16 +22,9 @@ mkdir subsets/fasta
 mkdir subsets/fodor
 
 
-# Generate subsets
-echo Generating new subset
-sh scripts/generate_subsets.sh $input_file $subset_size $num_of_subsets;
-
-# Generate fodor-formatted files
-echo Constructing FASTA-formatted subsets
-for i in subsets/fodor/*.fodor;
-do
-	cat $i | dos2unix | sh scripts/fodor2fasta.sh | dos2unix > subsets/fasta/`basename $i .fodor`.fasta
-done;
+# Generate subsets in Fodor and FASTA format (the alignment is read once)
+echo Generating new subsets
+./scripts/generateSubsets.py $input_file $subset_size $num_of_subsets;
 
 # Execute co-evolution analysis
 sh scripts/mainscript.sh
\ No newline at end of file
@@ -7,28 +7,29 @@
 # 2012-10-10
 
 # Aligns a set of weighted edgelists, reporting their weights
+#
+# Changelog:
+#    + 2026-10-18: Aligns the networks as one edges x networks matrix
+#                   (networkAlignment) instead of probing per-graph dicts
 
 import sys
-import networkx as nx	
+import networkAlignment
 
+# Weights as str() printed them; edges a network lacks are left empty
+def formatWeights(row):
+	return "\t".join([ '' if w != w else str(w) for w in row ])
 		
 def main():
 	if len(sys.argv) < 2: 
 		sys.exit("Usage: [Weighted edgelist1] [Weighted edgelist2...]")
 
 	#Read the graphs
-	graphs = [ nx.read_weighted_edgelist(path) for path in sys.argv[1:] ]
-
-	graphDicts = [ { tuple(sorted([e1, e2])) : G[e1][e2]['weight'] for e1, e2 in G.edges_iter()} for G in graphs]
-	allEdgePairs = set().union(*[G.keys() for G in graphDicts])
+	edges, weights = networkAlignment.alignEdges([ networkAlignment.readEdges(path) for path in sys.argv[1:] ])
 	
 	#Write a header
 	print "\t".join(['node1', 'node2'] + sys.argv[1:] + ['\n'])
 	
-	#For every edge pair, construct and write a line like: node1 (tab) node2 (tab) weight1 (tab) weight2...
-	print "\n".join(["\t".join([str(edge[0]), str(edge[1]), "\t".join([str(G.get(edge,'')) for G in graphDicts])]) for edge in allEdgePairs])
-		
-	
-	
+	#For every edge pair, write a line like: node1 (tab) node2 (tab) weight1 (tab) weight2...
+	networkAlignment.writeEdgeRows(sys.stdout, edges, weights, formatWeights)
 
-main()
\ No newline at end of file
+main()
@@ -0,0 +1,180 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Reads in a set of co-evolution networks (tab-separated "pos1 pos2 score"
+# .map files), matches equivalent (pos1, pos2) pairs and writes summary
+# statistics across the networks for those pairs, as AverageNetwork.exe
+# does:
+#    keyI keyJ mean stdev n
+# for every pair of residues keyI < keyJ, residues ordered by number, then
+# insertion code (orderByNumberPlusICode).  stdev is the sample standard
+# deviation; pairs seen in fewer than two networks have NaN statistics.
+#
+# Networks are streamed one file at a time.  Residues are interned into a
+# dense index and every network is folded into count/mean/M2 arrays with
+# Welford's update, so memory is O(R^2) in the number of residues however
+# many networks are averaged.  --min-n drops pairs present in fewer
+# networks (mainscript.sh keeps ZNMI pairs present in more than 50 subsets).
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created to replace AverageNetwork.exe
+
+import sys
+import argparse
+import numpy as np
+import fastaIO
+
+PROGRAM_NAME = "averageNetwork"
+
+def errorOut(message, code):
+	sys.stderr.write("[%s] Error: %s\n" % (PROGRAM_NAME, message))
+	sys.stderr.write("[%s] Terminating with error code %d\n" % (PROGRAM_NAME, code))
+	exit(code)
+
+# Sort key of a residue ID: its number (without the insertion code), then
+#  the ID itself
+def residueSortKey(resnum):
+	try:
+		return (int(resnum), resnum)
+	except ValueError:
+		try:
+			return (int(resnum[:-1]), resnum)
+		except ValueError:
+			errorOut("Residue %s is not a number with an optional insertion code" % resnum, 252)
+
+def orderByNumberPlusICode(resnums):
+	return sorted(resnums, key=residueSortKey)
+
+# Reads a network as (pos1, pos2, score) arrays.  Empty lines are ignored;
+#  a pair listed twice keeps its last score.  Lines are only checked one by
+#  one to report an error.
+def readNetwork(path):
+	with open(path) as f:
+		lines = [ line for line in f.read().splitlines() if line.strip() ]
+	if any(line.count('\t') != 2 for line in lines):
+		checkNetwork(path)
+
+	fields = "\t".join(lines).split('\t') if lines else []
+	try:
+		scores = np.array(fields[2::3], dtype=str).astype(np.float64)
+	except ValueError:
+		checkNetwork(path)
+	return np.array(fields[0::3], dtype=str), np.array(fields[1::3], dtype=str), scores
+
+# Reports the first malformed line of a network
+def checkNetwork(path):
+	with open(path) as f:
+		for linesRead, line in enumerate(f.read().splitlines(), 1):
+			if not line.strip():
+				continue
+			fields = line.split('\t')
+			if len(fields) != 3:
+				errorOut("Expected 3 fields on line %d but found %d in file %s" % (linesRead, len(fields), path), 254)
+			try:
+				float(fields[2])
+			except ValueError:
+				errorOut("Non-numeric data value found in field 3 on line %d in file %s" % (linesRead, path), 253)
+
+# Running count, mean and sum of squared deviations (M2) of every residue
+#  pair.  Residues are numbered as they are first seen; the statistics of
+#  residues u < v are kept at [u, v].  The arrays grow by doubling.
+class PairStatistics:
+	def __init__(self, capacity=64):
+		self.index = {}
+		self.count = np.zeros((capacity, capacity), dtype=np.int64)
+		self.mean = np.zeros((capacity, capacity))
+		self.m2 = np.zeros((capacity, capacity))
+
+	def residues(self):
+		return sorted(self.index, key=self.index.get)
+
+	def grow(self, capacity):
+		old = len(self.count)
+		if capacity <= old:
+			return
+		while old < capacity:
+			old *= 2
+		for field in ("count", "mean", "m2"):
+			values = getattr(self, field)
+			grown = np.zeros((old, old), dtype=values.dtype)
+			grown[:len(values), :len(values)] = values
+			setattr(self, field, grown)
+
+	# Residue IDs of an array of names, interning new names
+	def intern(self, names):
+		uniq, inverse = np.unique(names, return_inverse=True)
+		ids = np.array([ self.index.setdefault(name, len(self.index)) for name in uniq.tolist() ], dtype=np.int64)
+		self.grow(len(self.index))
+		return ids[inverse]
+
+	# Folds one network into the statistics (Welford's update)
+	def add(self, names1, names2, scores):
+		if len(scores) == 0:
+			return
+		ids1 = self.intern(names1)
+		ids2 = self.intern(names2)
+		u = np.minimum(ids1, ids2)
+		v = np.maximum(ids1, ids2)
+
+		# Last score of every distinct pair; self-pairs are never reported
+		keys = u*len(self.count) + v
+		last = len(keys) - 1 - np.unique(keys[::-1], return_index=True)[1]
+		last = last[u[last] != v[last]]
+		u, v, x = u[last], v[last], scores[last]
+
+		self.count[u, v] += 1
+		delta = x - self.mean[u, v]
+		self.mean[u, v] += delta / self.count[u, v]
+		self.m2[u, v] += delta * (x - self.mean[u, v])
+
+# Formats a number as .NET's default Double.ToString() does
+def dotNetDouble(x):
+	if np.isnan(x):
+		return "NaN"
+	if np.isinf(x):
+		return "Infinity" if x > 0 else "-Infinity"
+	return "%.15G" % (x + 0.0)
+
+# Writes the statistics of every residue pair (keyI < keyJ in
+#  orderByNumberPlusICode order) seen in at least minN networks
+def writeStatistics(out, stats, minN=0):
+	keys = orderByNumberPlusICode(stats.residues())
+	ids = np.array([ stats.index[key] for key in keys ], dtype=np.int64)
+
+	i, j = np.triu_indices(len(keys), 1)
+	u = np.minimum(ids[i], ids[j])
+	v = np.maximum(ids[i], ids[j])
+	n = stats.count[u, v]
+	selected = n >= minN
+	i, j, u, v, n = i[selected], j[selected], u[selected], v[selected], n[selected]
+
+	with np.errstate(divide="ignore", invalid="ignore"):
+		mean = np.where(n > 0, stats.mean[u, v], np.nan)
+		stdev = np.sqrt(stats.m2[u, v] / (n - 1))
+
+	fastaIO.writeBlocks(out, ("%s\t%s\t%s\t%s\t%d\n" % (keys[a], keys[b], dotNetDouble(m), dotNetDouble(s), c) for a, b, m, s, c in zip(i.tolist(), j.tolist(), mean.tolist(), stdev.tolist(), n.tolist())))
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Mean and standard deviation of every residue pair score across co-evolution networks")
+	parser.add_argument("networks", nargs="+", help="Networks (tab-separated \"pos1 pos2 score\" .map files)")
+	parser.add_argument("--min-n", type=int, default=0, help="Only write pairs present in at least this many networks (default: 0)")
+	return parser.parse_args()
+
+#Main body
+def main():
+	args = parseArgs()
+
+	stats = PairStatistics()
+	for path in args.networks:
+		stats.add(*readNetwork(path))
+
+	writeStatistics(sys.stdout, stats, args.min_n)
+
+if __name__ == '__main__':
+	main()
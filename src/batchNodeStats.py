@@ -0,0 +1,131 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Calculates node statistics (EVC, MEW) for whole directories of protein
+#   co-evolution networks in one run.  Each network is read once and every
+#   requested statistic is computed from the same adjacency; the output of
+#   statistic S for network DIR/NET is written to OUT/S/DIR/NET.S, i.e. the
+#   same files that "S.py DIR/NET > S/DIR/NET.S" produces for every network
+#   (see perform_evc_analyses.sh).
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+#    + 2026-10-18: Networks that would overwrite each other's output are
+#                   rejected; statistics share one calling convention
+
+import os
+import sys
+import glob
+import argparse
+import multiprocessing
+import edgelistIO
+import nodeStats
+
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
+
+# Expands the command line inputs (directories, glob patterns or single
+#  files) to a sorted list of distinct network files
+def networkPaths(inputs):
+	paths = []
+	for item in inputs:
+		if os.path.isdir(item):
+			paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item)) if os.path.isfile(os.path.join(item, name)))
+		elif os.path.isfile(item):
+			paths.append(item)
+		else:
+			matches = sorted(glob.glob(item))
+			if not matches:
+				errorOut("No networks found for %s\n" % item, 1)
+			paths.extend(path for path in matches if os.path.isfile(path))
+
+	# A file matched by several inputs is processed once
+	seen = set()
+	unique = []
+	for path in paths:
+		if os.path.abspath(path) not in seen:
+			seen.add(os.path.abspath(path))
+			unique.append(path)
+	return unique
+
+# Output file of a statistic for one network: OUT/stat/DIR/NET.stat, where
+#  DIR is the name of the directory holding the network
+def outputPath(outDir, stat, path):
+	subdir = os.path.basename(os.path.dirname(os.path.abspath(path)))
+	return os.path.join(outDir, stat, subdir, os.path.basename(path) + "." + stat)
+
+# Stops if two networks would be written to the same files (e.g. a/std/net
+#  and b/std/net both go to OUT/stat/std/net.stat)
+def checkOutputPaths(outDir, stat, paths):
+	seen = {}
+	for path in paths:
+		outPath = outputPath(outDir, stat, path)
+		if os.path.abspath(outPath) in seen:
+			errorOut("%s and %s would both be written to %s\n" % (seen[os.path.abspath(outPath)], path, outPath), 1)
+		seen[os.path.abspath(outPath)] = path
+
+# Computes and writes every requested statistic of one network; options
+#  are passed to every statistic's calculation
+def processNetwork(task):
+	path, stats, outDir, options = task
+	adj = edgelistIO.Adjacency(edgelistIO.readEdgelist(path))
+	
+	for stat in stats:
+		calculate, order = nodeStats.STATISTICS[stat]
+		try:
+			values = calculate(adj, **options)
+		except ZeroDivisionError as e:
+			raise ZeroDivisionError("%s: %s" % (path, e))
+		with open(outputPath(outDir, stat, path), "w") as out:
+			out.write(nodeStats.formatNodeValues(adj, values, order(adj)))
+	return path
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Node statistics of many weighted edgelists in one run")
+	parser.add_argument("inputs", nargs="+", help="Directories, glob patterns or weighted edgelists")
+	parser.add_argument("--stats", nargs="+", choices=sorted(nodeStats.STATISTICS), default=["evc", "max"], help="Statistics to calculate (default: evc max)")
+	parser.add_argument("--out-dir", default=".", help="Directory under which the STAT/DIR/ output directories are created (default: .)")
+	parser.add_argument("--workers", type=int, default=1, help="Number of processes over which the networks are spread (default: 1)")
+	parser.add_argument("--tol", type=float, default=0, help="Relative accuracy of EVC for large (sparse) networks; 0 means machine precision (default: 0)")
+	return parser.parse_args()
+
+#Main body
+def main():
+	args = parseArgs()
+	paths = networkPaths(args.inputs)
+	checkOutputPaths(args.out_dir, args.stats[0], paths)
+	
+	# Create the output directories up front so workers never race for them
+	for stat in args.stats:
+		for outSubdir in set(os.path.dirname(outputPath(args.out_dir, stat, path)) for path in paths):
+			if not os.path.isdir(outSubdir):
+				os.makedirs(outSubdir)
+	
+	tasks = [ (path, args.stats, args.out_dir, { "tol": args.tol }) for path in paths ]
+	if args.workers > 1:
+		pool = multiprocessing.Pool(args.workers)
+		done = pool.imap_unordered(processNetwork, tasks)
+	else:
+		pool = None
+		done = (processNetwork(task) for task in tasks)
+	
+	try:
+		for path in done:
+			sys.stdout.write(path + "\n")
+			sys.stdout.flush()
+	except ZeroDivisionError as e:
+		errorOut("%s\n" % e, 1)
+	
+	if pool is not None:
+		pool.close()
+		pool.join()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,87 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Builds the global maps of any number of subfamilies in one run, as
+# Get_Global_Map.sh does for one: every scored column of a subfamily
+# alignment is mapped to the residue of the subfamily's reference sequence
+# in that column, then to the column of the reference alignment holding
+# that residue, then to the canonical (e.g. LacI) numbering of that column.
+# Columns where the subfamily reference sequence has a gap are skipped.
+#
+# The reference alignment is read once, whatever the number of
+# subfamilies; numberings are kept as arrays and every map is written
+# directly as "column name" lines sorted by column.
+#
+# Usage:
+#    buildGlobalMaps.py REF_MSA GLOBAL_REF_NAME \
+#        --subfamily SF_MSA SF_REF_NAME_IN_SF_MSA SF_REF_NAME_IN_REF_MSA OUT ...
+# (OUT is a file, or - for standard output)
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created to replace Get_Global_Map.sh
+
+import sys
+import argparse
+import numpy as np
+import createMap
+
+# Entropy and gap cutoffs of the subfamily columns (as in Get_Global_Map.sh)
+MIN_ENTROPY = 0.198515243
+MAX_GAPS = .5
+
+class ReferenceAlignment:
+	def __init__(self, path, globalRefName):
+		self.ids, self.aln = createMap.readAlignment(path)
+		self.globalNames = np.array(createMap.canonName(self.aln[createMap.canonicalRow(self.ids, globalRefName)]), dtype=object)
+
+	# Reference column of every residue (numbered from 1) of a sequence
+	def residueColumns(self, name):
+		return np.flatnonzero(self.aln[createMap.canonicalRow(self.ids, name)] != createMap.GAP)
+
+# Subfamily column -> global name pairs of a subfamily
+def globalMap(ref, sfPath, sfNameSub, sfNameRef, minEntropy=MIN_ENTROPY, maxGaps=MAX_GAPS):
+	ids, aln = createMap.readAlignment(sfPath)
+	cRow = createMap.canonicalRow(ids, sfNameSub)
+	cols = createMap.columnMap(aln, cRow, minEntropy, maxGaps)[0]
+
+	# Residue number of every kept column; 0 where the reference sequence
+	#  has a gap (the name has an insertion code)
+	residues = np.cumsum(aln[cRow] != createMap.GAP)[cols]
+	residues[aln[cRow][cols] == createMap.GAP] = 0
+
+	refColumns = ref.residueColumns(sfNameRef)
+	mapped = (residues > 0) & (residues <= len(refColumns))
+	return cols[mapped], ref.globalNames[refColumns[residues[mapped] - 1]]
+
+def writeMap(path, cols, names):
+	out = sys.stdout if path == "-" else open(path, "w")
+	out.write("".join("%d\t%s\n" % pair for pair in zip(cols.tolist(), names.tolist())))
+	if out is not sys.stdout:
+		out.close()
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Subfamily column to global reference numbering maps")
+	parser.add_argument("refMSA", help="Reference alignment (FASTA)")
+	parser.add_argument("globalRefName", help="Name of the global reference sequence (e.g. LacI) in the reference alignment")
+	parser.add_argument("--subfamily", nargs=4, action="append", required=True, metavar=("SF_MSA", "SF_NAME_IN_SF", "SF_NAME_IN_REF", "OUT"), help="Subfamily alignment, the name of its reference sequence there and in the reference alignment, and the output map (- for stdout); repeat for every subfamily")
+	parser.add_argument("--min-entropy", type=float, default=MIN_ENTROPY, help="Subfamily columns with lower entropy are not mapped (default: %s)" % MIN_ENTROPY)
+	parser.add_argument("--max-gaps", type=float, default=MAX_GAPS, help="Subfamily columns with this gap fraction or more are not mapped (default: %s)" % MAX_GAPS)
+	return parser.parse_args()
+
+#Main body
+def main():
+	args = parseArgs()
+	ref = ReferenceAlignment(args.refMSA, args.globalRefName)
+
+	for sfPath, sfNameSub, sfNameRef, outPath in args.subfamily:
+		cols, names = globalMap(ref, sfPath, sfNameSub, sfNameRef, args.min_entropy, args.max_gaps)
+		writeMap(outPath, cols, names)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,21 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Converts a binary edgelist container (.bwel) back into a tab-separated
+# weighted edgelist (.wel), written to stdout
+
+import sys
+import edgelistIO
+
+def main():
+	if len(sys.argv) != 2:
+		sys.exit("Usage: [Binary edgelist]")
+
+	el = edgelistIO.readEdgelist(sys.argv[1])
+	edgelistIO.writeText(el, sys.stdout)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,31 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Writes a weighted edgelist (stdin) with every edge oriented as
+# "node1 node2 weight", node1 <= node2 (byte order), one line at a time, so
+# that it can be sorted externally for compositeNetwork.py --streaming.
+# Comments and blank lines are dropped; weights are copied unchanged.
+
+import sys
+import fastaIO
+
+def canonicalEdges(stream):
+	for line in stream:
+		fields = line.split('#', 1)[0].split()
+		if not fields:
+			continue
+		if len(fields) != 3:
+			sys.exit("Expected three fields per line in weighted edgelist")
+		node1, node2, weight = fields
+		if node1 > node2:
+			node1, node2 = node2, node1
+		yield "%s\t%s\t%s\n" % (node1, node2, weight)
+
+def main():
+	fastaIO.writeBlocks(sys.stdout, canonicalEdges(sys.stdin))
+
+if __name__ == '__main__':
+	main()
@@ -21,48 +21,35 @@
 #     DEF  C1  NPF  5
 # And so on, for all the distinct atoms (C1 code) in NPF.
 #
+# Contacting protein residues are written once each, as "chain\tresidue"
+# lines in the order of their first contacting atom.  With --batch, many
+# complexes are processed in one run (see parseArgs).
+#
 # Status: Complete, lightly tested
-# Version: 1.0
+# Version: 2.0
 # Language: Python
 # Changelog:
 #    + 2013-01-10: Created
 #	 + 2013-01-10: Marked complete, light testing for reasonability
 #                  in the course of use.
+#    + 2026-10-18: Contact thresholds are precomputed as an atom type x atom
+#                   type matrix and atoms are binned into a uniform grid, so
+#                   only atoms in neighboring cells are compared (vectorized);
+#                   residues are written once instead of once per atom pair;
+#                   added --batch for many PDBs and ligands per run
+#    + 2026-10-18: Reads atoms with the shared (cached) pdbIO parser
 
 import sys
-import math
-
-#Returns (0) record name, (1) serial, (2) atom role, (3) residue name, (4) chain, (5) seqno, (6) x, (7) y, (8) z
-def parseAtom(line):
-	return (line[0:6], int(line[6:11]), line[12:16].replace(" ", ""), line[17:20], line[21:22], line[22:27].strip(' '), float(line[30:38]), float(line[38:46]), float(line[46:54]))
-
-def getContactThresh(x,y,rDst, rDef, rCnt):
-	typeX = rDef[(x[2],x[3])]
-	typeY = rDef[(y[2],y[3])]
-	
-	bondType = rCnt[typeX][typeY-1]
-	return rDst[bondType]
-	
-#Distance between two atom records
-def distance(x, y):
-	dist = 0
-	delta = (x[6] - y[6])
-	dist += delta*delta
-	delta = (x[7] - y[7])
-	dist += delta*delta
-	delta = (x[8] - y[8])
-	dist += delta*delta
-	
-	return math.sqrt(dist)
-	
-def interact(x, y, rDst, rDef, rCnt):
-	return distance(x,y) < getContactThresh(x,y, rDst, rDef, rCnt)
+import argparse
+import numpy as np
+import pdbIO
 
-def main():
-	resmapConfigPath = sys.argv[1]
-	pdbPath = sys.argv[2]
-	ligPath = sys.argv[3]
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
 
+# Parses the DST, DEF and CNT records of a Resmap configuration file
+def readResmapConfig(resmapConfigPath):
 	#Read the resmap configuration file
 	confLines = [ line.strip() for line in open(resmapConfigPath) ]
 	
@@ -70,16 +57,143 @@ def main():
 	rDst = { line[5:7] : float(line[14:17]) for line in confLines if line[0:3] == "DST" }
 	rDef = { (line[5:8].replace(" ", ""), line[9:12]) : int(line[13:15]) for line in confLines if line[0:3] == "DEF" }
 	rCnt = { int(line[4:7]) : line[9:].split(' ') for line in confLines if line[0:3] == "CNT"}
+	return rDst, rDef, rCnt
+	
+# Contact threshold for every pair of atom types: thresh[typeX, typeY] is
+#  the DST distance of bond type CNT[typeX][typeY-1], or NaN where the
+#  configuration does not define one
+def thresholdMatrix(rDst, rDef, rCnt):
+	nTypes = max(rDef.values() + rCnt.keys() + [ len(row) for row in rCnt.values() ] + [0]) + 1
+	thresh = np.full((nTypes, nTypes), np.nan)
+	for typeX, bondTypes in rCnt.items():
+		for typeY, bondType in enumerate(bondTypes, 1):
+			if bondType in rDst:
+				thresh[typeX, typeY] = rDst[bondType]
+	return thresh
+
+# Atoms of a set of pdbIO records: residue (chain, seqno), Resmap atom type
+#  and coordinates
+class Atoms:
+	def __init__(self, records, rDef):
+		roles = zip(records["name"].tolist(), records["resName"].tolist())
+		missing = [ role for role in roles if role not in rDef ]
+		if missing:
+			errorOut("No Resmap DEF record for atom %s of %s\n" % missing[0], 1)
+		
+		self.residues = zip(records["chain"].tolist(), records["resSeq"].tolist())
+		self.types = np.array([ rDef[role] for role in roles ], dtype=np.int64)
+		self.xyz = records["xyz"]
+
+	def __len__(self):
+		return len(self.residues)
+
+# Uniform grid over the protein atoms with cells as wide as the largest
+#  contact threshold, so that every contact lies within the 27 cells around
+#  an atom.  Atoms are sorted by cell key to look cells up by bisection.
+class ContactGrid:
+	def __init__(self, xyz, cellSize):
+		self.cellSize = cellSize
+		self.origin = xyz.min(axis=0) if len(xyz) else np.zeros(3)
+		keys = self.cellKeys(self.cells(xyz))
+		self.order = np.argsort(keys, kind="mergesort")
+		self.keys = keys[self.order]
+
+	def cells(self, xyz):
+		return np.floor((xyz - self.origin) / self.cellSize).astype(np.int64)
+
+	# Packs cell coordinates into one integer (21 bits per axis)
+	def cellKeys(self, cells):
+		cells = cells + (1 << 20)
+		return (cells[:, 0] << 42) | (cells[:, 1] << 21) | cells[:, 2]
+
+	# Candidate (grid atom, query atom) pairs: every query point with every
+	#  grid atom in its own or a neighboring cell
+	def candidates(self, xyz):
+		cells = self.cells(xyz)
+		gridAtoms = []
+		queryAtoms = []
+		for offset in np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).reshape(3, -1).T:
+			keys = self.cellKeys(cells + offset)
+			start = np.searchsorted(self.keys, keys, side="left")
+			count = np.searchsorted(self.keys, keys, side="right") - start
+			gridAtoms.append(np.repeat(start - np.cumsum(count) + count, count) + np.arange(count.sum()))
+			queryAtoms.append(np.repeat(np.arange(len(xyz)), count))
+		return self.order[np.concatenate(gridAtoms)], np.concatenate(queryAtoms)
+
+# Indices of the protein atoms that contact any ligand atom, in protein
+#  order; atoms contact when their distance is less than the threshold of
+#  their types
+def contactingAtoms(prot, liga, thresh, grid):
+	pIdx, lIdx = grid.candidates(liga.xyz)
+	
+	pairThresh = thresh[prot.types[pIdx], liga.types[lIdx]]
+	if np.isnan(pairThresh).any():
+		bad = np.flatnonzero(np.isnan(pairThresh))[0]
+		errorOut("No Resmap CNT/DST contact defined for atom types %d and %d\n" % (prot.types[pIdx[bad]], liga.types[lIdx[bad]]), 1)
 	
+	# Summed in the same order as the original distance() so that contacts
+	#  at the threshold are decided identically
+	delta = prot.xyz[pIdx] - liga.xyz[lIdx]
+	delta *= delta
+	dist = np.sqrt((delta[:, 0] + delta[:, 1]) + delta[:, 2])
+	return np.unique(pIdx[dist < pairThresh])
+
+# Contacting residues, each once, in order of their first contacting atom
+def contactResidues(prot, atoms):
+	seen = set()
+	residues = []
+	for i in atoms.tolist():
+		if prot.residues[i] not in seen:
+			seen.add(prot.residues[i])
+			residues.append(prot.residues[i])
+	return residues
+
+def readProtein(pdbPath, rDef):
 	# Get ATOM records for protein
-	prot = [ parseAtom(line) for line in open(pdbPath) if line[0:6] == "ATOM  " ]
+	return Atoms(pdbIO.selectAtoms(pdbIO.readAtoms(pdbPath), ["ATOM  "]), rDef)
 	
+def readLigand(ligPath, rDef):
 	# GET ATOM and HETATM records for ligand
-	liga = [ parseAtom(line) for line in open(ligPath) if line[0:6] == "ATOM  " or line[0:6] == "HETATM" ]
+	return Atoms(pdbIO.selectAtoms(pdbIO.readAtoms(ligPath), ["ATOM  ", "HETATM"]), rDef)
+	
+# Complexes of a batch file: one "PDB ligand" pair of paths per line
+def readBatch(batchPath):
+	return [ tuple(line.split()[0:2]) for line in open(batchPath) if line.strip() and not line.startswith("#") ]
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Protein residues contacting a ligand, using Resmap contact definitions")
+	parser.add_argument("resmapConfigPath", help="Resmap configuration file (v 1.02) with DEF records for the ligand atoms")
+	parser.add_argument("pdbPath", nargs="?", help="Protein PDB file")
+	parser.add_argument("ligPath", nargs="?", help="Ligand ATOM/HETATM records")
+	parser.add_argument("--batch", help="File of \"PDB ligand\" path pairs, one complex per line; output lines are prefixed with both paths")
+	args = parser.parse_args()
+	if (args.batch is None) == (args.ligPath is None):
+		parser.error("Give either a PDB and a ligand file or --batch")
+	return args
+
+def main():
+	args = parseArgs()
+	rDst, rDef, rCnt = readResmapConfig(args.resmapConfigPath)
+	thresh = thresholdMatrix(rDst, rDef, rCnt)
+	cellSize = max(rDst.values())
+	
+	if args.batch is None:
+		complexes = [ (args.pdbPath, args.ligPath) ]
+	else:
+		complexes = readBatch(args.batch)
 	
-	for pAtom in prot:
-		for lAtom in liga:
-			if interact(pAtom, lAtom, rDst, rDef, rCnt):
-				sys.stdout.write("%s\t%s\n" % (pAtom[4], pAtom[5]))
+	# A protein is read and gridded once for consecutive complexes that
+	#  share it, so list the ligands of a PDB together in batch files
+	prot = None
+	for pdbPath, ligPath in complexes:
+		if prot is None or pdbPath != protPath:
+			protPath = pdbPath
+			prot = readProtein(pdbPath, rDef)
+			grid = ContactGrid(prot.xyz, cellSize)
+		liga = readLigand(ligPath, rDef)
+		
+		prefix = "" if args.batch is None else "%s\t%s\t" % (pdbPath, ligPath)
+		for chain, residue in contactResidues(prot, contactingAtoms(prot, liga, thresh, grid)):
+			sys.stdout.write("%s%s\t%s\n" % (prefix, chain, residue))
 
 main()
\ No newline at end of file
@@ -7,35 +7,25 @@
 # 2012-12-12
 
 # Composes multiple translation tables
+#
+# Changelog:
+#    + 2026-10-18: Composes the tables with renumbering.py.  Residues that a
+#                   later table does not translate are now dropped (they
+#                   used to shift the pairing of every later residue);
+#                   pairs are written sorted by the first numbering.
 
 import sys
-
-def readTransTable(translatePath):
-	transTable = {}
-	for line in open(translatePath):	
-		fields = line.strip().split('\t')
-		transTable[fields[0]] = fields[1]
-	return transTable
+import renumbering
 	
 #Main body	
 def main():
 	if len(sys.argv) < 3: 
 		sys.exit("Usage: [Translation table 1] [Translation table 2] ... [Translation table N]")
 	
+	#Propagate the initial numberings through the translation tables
+	composed = renumbering.readChain(sys.argv[1:])
 	
-	
-	#Read the translation tables
-	tables = [ readTransTable(path) for path in sys.argv[1:] ]
-	
-	#Propagate the initial numberings through the translation table
-	initialNumberings = [ k for k in tables[0].keys() ]
-	finalNumberings = initialNumberings
-	for table in tables:
-		finalNumberings = [ table[entry] for entry in finalNumberings if entry in table ]
-		
-	result = zip(initialNumberings, finalNumberings)
-	
-	for entry in result:
+	for entry in composed.pairs():
 		print "\t".join(entry)
 	
 main()
\ No newline at end of file
@@ -7,54 +7,111 @@
 
 # 2013-07-15
 # Averages networks produced by divergent co-evolutionary strategies together
+#
+# With --streaming, networks too large to hold in memory are composited in
+# two passes over the files: the first gathers the mean and variance of
+# every network's weights chunk by chunk, the second merges the networks
+# edge by edge and writes the average z-score of every edge in sorted
+# order.  Memory then depends on the number of networks, not of edges.
+# Streamed networks must be text edgelists listing every edge once as
+# "node1 node2 weight" with node1 <= node2, sorted by node1, then node2
+# (byte order), e.g.:
+#    ./canonicalizeEdgelist.py < net.wel | LC_ALL=C sort -t "`printf '\t'`" -k1,1 -k2,2 > net.sorted.wel
 
-# Version: 0.1
+# Version: 0.3
 # Changelog:
 # 	+ 2013-07-15: Created, forked from alignMultiNetworks_new.py
+# 	+ 2026-10-18: Normalizes and averages the networks as one edges x
+# 	              networks matrix (networkAlignment)
+# 	+ 2026-10-18: Added the out-of-core --streaming mode
 
 import sys
-import networkx as nx
+import heapq
+import argparse
+import itertools
 import numpy
-import scipy
-import scipy.stats
+import fastaIO
+import networkAlignment
 
+# Lines read at a time by the first streaming pass
+CHUNK_LINES = 1000000
 
-#Thresholds edges based on a z-score		
-def zNormalize(G):
-	weightStats = scipy.stats.describe([ G[e1][e2]['weight'] for e1,e2 in G.edges_iter() ])
-		
-	mean = weightStats[2]
-	stdev = scipy.sqrt(weightStats[3])
-	
-	for e1, e2 in G.edges_iter():
-		G[e1][e2]['weight'] = (G[e1][e2]['weight'] - mean)/stdev
-		
-def main():
-	if len(sys.argv) < 2: 
-		sys.exit("Usage: [Weighted edgelist1] [Weighted edgelist2...]")
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
 
-	#Read the graphs
-	graphs = [ nx.read_weighted_edgelist(path) for path in sys.argv[1:] ]
-	
-	for g in graphs:
-		zNormalize(g)
+# Fields of the edge lines of a text edgelist, as networkx reads them ('#'
+#  starts a comment; blank lines are skipped)
+def edgeFields(path):
+	with open(path) as f:
+		for line in f:
+			fields = line.split('#', 1)[0].split()
+			if not fields:
+				continue
+			if len(fields) != 3:
+				errorOut("Expected three fields per line in %s\n" % path, 1)
+			yield fields
+
+# Mean and sample standard deviation of the weights of a network, combining
+#  the statistics of successive chunks (Chan et al.)
+def weightStatistics(path):
+	fields = edgeFields(path)
+	n, mean, m2 = 0, 0.0, 0.0
+	while True:
+		chunk = numpy.array([ float(edge[2]) for edge in itertools.islice(fields, CHUNK_LINES) ])
+		if len(chunk) == 0:
+			break
+		chunkMean = chunk.mean()
+		delta = chunkMean - mean
+		total = n + len(chunk)
+		mean += delta * len(chunk) / total
+		m2 += ((chunk - chunkMean)**2).sum() + delta*delta * n * len(chunk) / total
+		n = total
+	if n < 2:
+		errorOut("%s needs at least two edges to be z-normalized\n" % path, 1)
+	return mean, numpy.sqrt(m2 / (n - 1))
+
+# Edges of a canonical, sorted network as (node1, node2, index, z-score)
+def normalizedEdges(path, index, mean, stdev):
+	previous = None
+	for node1, node2, weight in edgeFields(path):
+		if node1 > node2 or (previous is not None and (node1, node2) <= previous):
+			errorOut("%s is not a sorted edgelist listing each edge once as node1 <= node2 (at %s %s)\n" % (path, node1, node2), 1)
+		previous = (node1, node2)
+		yield node1, node2, index, (float(weight) - mean) / stdev
+
+# Average z-score of every edge of the merged networks, in sorted order
+def streamComposite(paths):
+	stats = [ weightStatistics(path) for path in paths ]
+	merged = heapq.merge(*[ normalizedEdges(path, k, mean, stdev) for k, (path, (mean, stdev)) in enumerate(zip(paths, stats)) ])
+	for edge, group in itertools.groupby(merged, lambda e: (e[0], e[1])):
+		scores = [ e[3] for e in group ]
+		yield edge, sum(scores) / len(scores)
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Average of the z-normalized weights of several networks")
+	parser.add_argument("networks", nargs="+", help="Weighted edgelists")
+	parser.add_argument("--streaming", action="store_true", help="Composite canonical, sorted text edgelists in two passes without loading them")
+	return parser.parse_args()
+
+def main():
+	args = parseArgs()
 
-	graphDicts = [ { tuple(sorted([e1, e2])) : G[e1][e2]['weight'] for e1, e2 in G.edges_iter()} for G in graphs]
-	allEdgePairs = set().union(*[G.keys() for G in graphDicts])
-	
 	#Write a header
-	print "\t".join(['node1', 'node2', 'average'] + sys.argv[1:] + ['\n'])
-	
-	#For every edge pair, construct and write a line like: node1 (tab) node2 (tab) weight1 (tab) weight2...	
-	for edge in allEdgePairs:
-		scores = [ x for x in [ G.get(edge, '') for G in graphDicts] if x != '' ]
-		avgScore = numpy.mean(scores)
-		
-		print str.format("{0!s}\t{1!s}\t{2!s}", edge[0], edge[1], avgScore)
-		
-		#print "\t".join([str(edge[0]), str(edge[1]), str(avgScore), "\t".join([str(G.get(edge,'')) for G in graphDicts])])
-		
-	
+	print "\t".join(['node1', 'node2', 'average'] + args.networks + ['\n'])
+
+	if args.streaming:
+		fastaIO.writeBlocks(sys.stdout, ("%s\t%s\t%r\n" % (edge[0], edge[1], avgScore) for edge, avgScore in streamComposite(args.networks)))
+		return
+
+	#Read the graphs, thresholding edges based on a z-score
+	networks = [ networkAlignment.readEdges(path) for path in args.networks ]
+	networks = [ (node1, node2, networkAlignment.zNormalize(weights)) for node1, node2, weights in networks ]
+
+	edges, weights = networkAlignment.alignEdges(networks)
+	avgScores = numpy.nanmean(weights, axis=1)
 	
+	#For every edge pair, write a line like: node1 (tab) node2 (tab) average weight
+	networkAlignment.writeEdgeRows(sys.stdout, edges, avgScores[:, numpy.newaxis], lambda row: repr(row[0]))
 
-main()
\ No newline at end of file
+main()
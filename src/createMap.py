@@ -7,82 +7,108 @@
 # 2012-11-27
 
 # Creates a column-to-residue map file
+#
+# Status: Complete
+# Version: 1.2
+# Language: Python
+# Changelog:
+#    + 2012-11-27: Created
+#    + 2026-10-18: The alignment is encoded once as a (rows x cols) uint8
+#                   array; gap fractions, entropies and canonical names are
+#                   computed vectorized from a per-column symbol count table
+#    + 2026-10-18: Reads the alignment with fastaIO; the map is built by
+#                   importable functions (see buildGlobalMaps.py)
 
-import Bio.SeqIO
-import math
 import sys
+import numpy as np
+import fastaIO
 
-def colGapPct(column):
-	return float(column.count('-')) / len(column)
-	
-def entropy(column):
-	colLen = len(column)
-	
-	allGlyphs=set(column)
-	countDict = { glyph : 0 for glyph in allGlyphs }
-	
-	for glyph in column:
-		countDict[glyph] += 1
-	
-	glyphFreq = [ float(countDict[glyph]) / colLen for glyph in allGlyphs ]
-	
-	return -sum([p * math.log(p) for p in glyphFreq])
-	
+GAP = ord('-')
+	
+# Alignment as a (rows x cols) array of character codes
+def encodeAlignment(seqs):
+	cols = len(seqs[0])
+	if any(len(seq) != cols for seq in seqs):
+		sys.exit("Sequences in the alignment differ in length")
+	return np.frombuffer("".join(seqs), dtype=np.uint8).reshape(len(seqs), cols)
+	
+# Number of occurrences of every character code (0-255) in every column, as
+#  a (cols x 256) table, counted in a single bincount over (column, code)
+#  keys
+def symbolCounts(aln):
+	cols = aln.shape[1]
+	keys = aln.astype(np.int64) + 256*np.arange(cols)
+	return np.bincount(keys.ravel(), minlength=256*cols).reshape(cols, 256)
+	
+def colGapPct(counts):
+	return counts[:, GAP] / counts.sum(axis=1).astype(np.float64)
+	
+# Shannon entropy (natural log) of every column
+def entropy(counts):
+	p = counts / counts.sum(axis=1).astype(np.float64)[:, np.newaxis]
+	terms = np.zeros(p.shape)
+	present = counts > 0
+	terms[present] = p[present] * np.log(p[present])
+	return -terms.sum(axis=1)
+	
+# Residue name of every column of the canonical row: the residue number
+#  (a cumulative count of non-gap positions), with an insertion code A, B,
+#  ... added for each gap after the last residue
 def canonName(row):
-	num = 0
-	iCode = 'A'
+	notGap = row != GAP
+	num = np.cumsum(notGap)
 	
-	result=[]
-	for glyph in row:
-		if glyph == '-':
-			result.append(str(num) + iCode)
-			iCode=chr(ord(iCode)+1)
-		else:
-			num += 1
-			result.append(str(num))
-			iCode = 'A'
-	return result
-
-def main():
-	path = sys.argv[1]
-	canonID = sys.argv[2]
+	# Position of each gap within its run of gaps
+	position = np.arange(len(row))
+	lastResidue = np.maximum.accumulate(np.where(notGap, position, -1))
+	iCode = position - lastResidue - 1
 	
-	minEntropy = float(sys.argv[3])
-	minGaps = float(sys.argv[4])
+	return [ str(n) if residue else str(n) + chr(ord('A') + i) for n, residue, i in zip(num.tolist(), notGap.tolist(), iCode.tolist()) ]
 
-	msa = list(Bio.SeqIO.parse(path, "fasta"))
-	
-	rows = len(msa)
-	cols = len(msa[0].seq)
-	
-	columns = [ [ row.seq[c] for row in msa] for c in range(cols) ]
-	
-	#Get the canonical row
-	cRow = [ row for row in msa if row.id == canonID ]
+# Names (first word of the title) and encoded rows of a FASTA alignment
+def readAlignment(path):
+	with open(path) as f:
+		msa = list(fastaIO.readFasta(f))
+	if not msa:
+		sys.exit("The alignment is empty")
+	return [ name for name, seq in msa ], encodeAlignment([ seq for name, seq in msa ])
+
+# Index of the canonical row
+def canonicalRow(ids, canonID):
+	cRow = [ i for i, rowID in enumerate(ids) if rowID == canonID ]
 	if len(cRow) < 1:
 		sys.exit("Canonical row not found")
 		
 	if len(cRow) > 1:
 		sys.exit("Duplicate canonical rows found")
 		
-	cRow = cRow[0]
-	
-	cName = canonName(cRow.seq)
+	return cRow[0]
+
+# Columns with a gap fraction below minGaps and an entropy of at least
+#  minEntropy, with their canonical names
+def columnMap(aln, cRow, minEntropy, minGaps):
+	cName = np.array(canonName(aln[cRow]), dtype=object)
+	
+	counts = symbolCounts(aln)
+	kept = np.flatnonzero((colGapPct(counts) < minGaps) & (entropy(counts) >= minEntropy))
+	return kept, cName[kept].tolist()
+
+def main():
+	path = sys.argv[1]
+	canonID = sys.argv[2]
 	
-	gapPct = [ colGapPct(column) for column in columns ]
-	colEnt = [ entropy(column) for column in columns ]
+	minEntropy = float(sys.argv[3])
+	minGaps = float(sys.argv[4])
+
+	ids, aln = readAlignment(path)
 	
-	meta = zip(range(cols), cName, cRow, gapPct, colEnt)
+	#Get the canonical row
+	cRow = canonicalRow(ids, canonID)
 	
-	meta = [ m for m in meta if float(m[3]) < minGaps and float(m[4]) >= minEntropy ]
+	cols, names = columnMap(aln, cRow, minEntropy, minGaps)
 	
 	#Print out column -> canonical name
-	print "\n".join(str(m[0])+"\t"+str(m[1]) for m in meta)
-	
-	#Print out canonical name -> entropy
-	#print "\n".join(str(m[1])+"\t"+str(m[4]) for m in meta)
+	print "\n".join(str(col)+"\t"+name for col, name in zip(cols.tolist(), names))
 	
-		
-
-
-main()
\ No newline at end of file
+if __name__ == '__main__':
+	main()
@@ -10,24 +10,163 @@
 
 # Creates a scatterplot matrix (off-diagonals) with a kernal density estimate (KDE)
 # of the distribution of (univariate) data on the diagonal
+#
+# With --density, the off-diagonal panels are 2-D histograms (log-scaled
+# counts in --bins x --bins cells) instead of one marker per row, and the
+# diagonal KDEs are computed on a grid by binning the data and convolving
+# with the Gaussian kernel by FFT (Scott's bandwidth, as gaussian_kde).
+# --overlay N adds markers for a subsample of about N rows, drawn evenly from
+# equal-width strata of the first column so that its sparse tails are kept.
+# The drawing time then no longer depends on the number of rows.
+#
+# Usage: create_scatterplot.py [--density [--bins B] [--overlay N]] table.txt figure.png
+#
+# Changelog:
+#    + 2026-10-18: Added the binned density mode (--density) for large tables
 
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas
-import sys
+import argparse
+from matplotlib.colors import LogNorm
 
-infile=sys.argv[1]
-outfile=sys.argv[2]
+RANGE_PADDING = 0.1
+KDE_GRID = 1024
 
-maindata = pandas.read_csv(infile, sep="\t")
+# Axis limits of a column: its range padded by range_padding/2 on either
+#  side, as scatter_matrix pads them
+def paddedRange(values, padding=RANGE_PADDING):
+	lo, hi = np.min(values), np.max(values)
+	extra = (hi - lo) * padding / 2.
+	if extra == 0:
+		extra = 0.5
+	return lo - extra, hi + extra
 
-plt.rcParams['patch.facecolor'] = 'k'	# Make the markers black
+# Gaussian KDE of values at gridSize points spanning [lo, hi]; the values
+#  are linearly binned onto the grid and convolved with the kernel by FFT
+def binnedKDE(values, lo, hi, gridSize=KDE_GRID):
+	grid = np.linspace(lo, hi, gridSize)
+	if len(values) < 2 or np.std(values) == 0:
+		return grid, np.zeros(gridSize)
 
-# Plot
-ax = pandas.tools.plotting.scatter_matrix(maindata, alpha=0.1, marker='k.', figsize=(8,8), diagonal='kde', range_padding=0.1)
+	# Scott's rule, as scipy.stats.gaussian_kde
+	bandwidth = np.std(values, ddof=1) * len(values)**(-1/5.)
+	delta = grid[1] - grid[0]
 
-# Give a small inter-plot spacing
-plt.subplots_adjust(wspace=.05, hspace=.05)
+	pos = (values - lo) / delta
+	left = np.clip(np.floor(pos).astype(np.int64), 0, gridSize - 1)
+	frac = pos - left
+	counts = np.bincount(left, weights=1 - frac, minlength=gridSize + 1) + np.bincount(left + 1, weights=frac, minlength=gridSize + 1)
+	counts = counts[:gridSize]
 
-#Save the figure
-plt.savefig(outfile, dpi=600)
\ No newline at end of file
+	reach = min(gridSize - 1, int(np.ceil(4 * bandwidth / delta)))
+	offsets = np.arange(-reach, reach + 1) * delta
+	kernel = np.exp(-0.5 * (offsets / bandwidth)**2) / (bandwidth * np.sqrt(2 * np.pi))
+
+	size = 1 << int(np.ceil(np.log2(gridSize + 2*reach + 1)))
+	density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)[reach:reach + gridSize]
+	return grid, np.maximum(density, 0) / len(values)
+
+# Row indices of a subsample of about size rows.  Rows are binned into
+#  equal-width strata of values and every stratum gets an equal share of the
+#  sample (the unused share of small strata going to the others).
+def stratifiedSample(values, size, strata, seed):
+	if len(values) <= size:
+		return np.arange(len(values))
+
+	rng = np.random.RandomState(seed)
+	lo, hi = np.min(values), np.max(values)
+	if hi > lo:
+		bins = np.minimum(((values - lo) / (hi - lo) * strata).astype(np.int64), strata - 1)
+	else:
+		bins = np.zeros(len(values), dtype=np.int64)
+	counts = np.bincount(bins, minlength=strata)
+
+	quota = np.zeros(strata, dtype=np.int64)
+	remaining = size
+	nonempty = [ s for s in np.argsort(counts, kind="mergesort").tolist() if counts[s] > 0 ]
+	for k, s in enumerate(nonempty):
+		quota[s] = min(counts[s], remaining // (len(nonempty) - k))
+		remaining -= quota[s]
+
+	order = np.argsort(bins, kind="mergesort")
+	starts = np.concatenate([[0], np.cumsum(counts)])
+	sample = [ rng.choice(order[starts[s]:starts[s+1]], quota[s], replace=False) for s in nonempty ]
+	return np.sort(np.concatenate(sample))
+
+# Scatterplot matrix of a table with binned density panels
+def densityMatrix(maindata, bins, overlay, strata, seed):
+	names = list(maindata.columns)
+	data = maindata.values.astype(np.float64)
+	n = len(names)
+	finite = np.isfinite(data)
+	limits = [ paddedRange(data[finite[:, k], k]) for k in range(n) ]
+
+	if overlay > 0:
+		sampled = data[stratifiedSample(np.where(finite[:, 0], data[:, 0], np.nanmin(data[:, 0])), overlay, strata, seed)]
+
+	fig, axes = plt.subplots(n, n, figsize=(8,8), squeeze=False)
+	for i in range(n):
+		for j in range(n):
+			ax = axes[i, j]
+			if i == j:
+				grid, density = binnedKDE(data[finite[:, i], i], limits[i][0], limits[i][1])
+				# Scaled into the panel's axis limits (scatter_matrix shares the
+				#  row's tick labels on the diagonal too)
+				if density.max() > 0:
+					density = limits[i][0] + density / density.max() * (limits[i][1] - limits[i][0]) * 0.9
+				else:
+					density = np.full(len(grid), limits[i][0])
+				ax.plot(grid, density, 'k-')
+			else:
+				both = finite[:, i] & finite[:, j]
+				counts = np.histogram2d(data[both, j], data[both, i], bins=bins, range=[limits[j], limits[i]])[0]
+				ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', extent=limits[j] + limits[i], aspect='auto', interpolation='nearest', cmap='Greys', norm=LogNorm())
+				if overlay > 0:
+					ax.plot(sampled[:, j], sampled[:, i], 'k.', alpha=0.1)
+
+			ax.set_xlim(limits[j])
+			ax.set_ylim(limits[i])
+
+			# Labels on the outer panels only, as scatter_matrix
+			if i == n - 1:
+				ax.set_xlabel(names[j])
+			else:
+				ax.set_xticklabels([])
+			if j == 0:
+				ax.set_ylabel(names[i])
+			else:
+				ax.set_yticklabels([])
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Scatterplot matrix with KDEs on the diagonal")
+	parser.add_argument("infile", help="Tab-separated table with a header line")
+	parser.add_argument("outfile", help="Figure file")
+	parser.add_argument("--density", action="store_true", help="Draw binned densities instead of one marker per row")
+	parser.add_argument("--bins", type=int, default=100, help="Cells per axis of the density panels (default: 100)")
+	parser.add_argument("--overlay", type=int, default=0, help="Also draw markers for a stratified subsample of about this many rows (default: 0, none)")
+	parser.add_argument("--strata", type=int, default=10, help="Strata of the first column the subsample is drawn from (default: 10)")
+	parser.add_argument("--seed", type=int, default=0, help="Seed of the subsample (default: 0)")
+	return parser.parse_args()
+
+def main():
+	args = parseArgs()
+
+	maindata = pandas.read_csv(args.infile, sep="\t")
+
+	plt.rcParams['patch.facecolor'] = 'k'	# Make the markers black
+
+	# Plot
+	if args.density:
+		densityMatrix(maindata, args.bins, args.overlay, args.strata, args.seed)
+	else:
+		ax = pandas.tools.plotting.scatter_matrix(maindata, alpha=0.1, marker='k.', figsize=(8,8), diagonal='kde', range_padding=0.1)
+
+	# Give a small inter-plot spacing
+	plt.subplots_adjust(wspace=.05, hspace=.05)
+
+	#Save the figure
+	plt.savefig(args.outfile, dpi=600)
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,273 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Reading and writing of weighted edgelists, either as text (.wel; the
+# "node1 node2 weight" format written by mainscript.sh and read by
+# networkx.read_weighted_edgelist) or as a compact binary container (.bwel)
+# that can be memory-mapped.  Networks are held as NumPy arrays (interned
+# node IDs and a CSR adjacency), without networkx.
+#
+# Binary layout (little-endian):
+#    header : 8-byte magic, int64 nNodes, int64 nEdges, int64 nameBytes
+#    weight : float64[nEdges]
+#    src    : int32[nEdges]
+#    dst    : int32[nEdges]
+#    names  : nameBytes bytes, node names joined by newlines
+#
+# Edges are stored in file order (duplicates included) and nodes are
+# numbered in order of first appearance, so a graph built from a .bwel file
+# is identical to one read from the .wel file it was converted from.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+#    + 2026-10-18: Added the CSR adjacency and networkx iteration orders
+#    + 2026-10-18: Added dense (.npy) networks
+
+import io
+import struct
+import numpy as np
+
+MAGIC = "CEWEL\x00\x01\x00"
+HEADER = struct.Struct("<8sqqq")
+
+class WeightedEdgelist:
+	def __init__(self, nodes, src, dst, weight):
+		self.nodes = nodes
+		self.src = src
+		self.dst = dst
+		self.weight = weight
+
+	def __len__(self):
+		return len(self.weight)
+
+# Numbers node names in order of first appearance (as networkx adds them)
+def internNodes(endpoints):
+	uniq, first, inverse = np.unique(endpoints, return_index=True, return_inverse=True)
+	order = np.argsort(first)
+	rank = np.empty(len(order), dtype=np.int32)
+	rank[order] = np.arange(len(order), dtype=np.int32)
+	return uniq[order], rank[inverse]
+
+# Parses the text of a weighted edgelist.  As in networkx, '#' starts a
+#  comment and every remaining line holds exactly three fields.
+def parseText(text):
+	if '#' in text:
+		text = "\n".join(line.split('#', 1)[0] for line in text.splitlines())
+
+	fields = text.split()
+	if not fields:
+		return WeightedEdgelist(np.array([], dtype=str), np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32), np.zeros(0))
+	if len(fields) % 3 != 0:
+		raise ValueError("Expected three fields per line in weighted edgelist")
+
+	table = np.array(fields).reshape(-1, 3)
+	nodes, ids = internNodes(table[:, :2].ravel())
+	return WeightedEdgelist(nodes, ids[0::2], ids[1::2], table[:, 2].astype(np.float64))
+
+# Reads an edgelist from the contents of a binary container
+def parseBinary(data):
+	nNodes, nEdges, nameBytes = HEADER.unpack_from(data)[1:]
+	offset = HEADER.size
+	weight = np.frombuffer(data, dtype="<f8", count=nEdges, offset=offset)
+	offset += 8*nEdges
+	src = np.frombuffer(data, dtype="<i4", count=nEdges, offset=offset)
+	offset += 4*nEdges
+	dst = np.frombuffer(data, dtype="<i4", count=nEdges, offset=offset)
+	offset += 4*nEdges
+	return WeightedEdgelist(namesFromBytes(data[offset:offset+nameBytes], nNodes), src, dst, weight)
+
+def namesFromBytes(data, nNodes):
+	return np.array(data.split("\n") if nNodes > 0 else [], dtype=str)
+
+def isBinary(path):
+	with open(path, "rb") as f:
+		return f.read(len(MAGIC)) == MAGIC
+
+# Memory-maps a binary container; the edge arrays are read-only views of
+#  the file and are only paged in as they are used
+def readBinary(path):
+	with open(path, "rb") as f:
+		nNodes, nEdges, nameBytes = HEADER.unpack(f.read(HEADER.size))[1:]
+		f.seek(HEADER.size + 16*nEdges)
+		nodes = namesFromBytes(f.read(nameBytes), nNodes)
+
+	if nEdges == 0:
+		empty = np.zeros(0)
+		return WeightedEdgelist(nodes, empty.astype("<i4"), empty.astype("<i4"), empty)
+
+	offset = HEADER.size
+	weight = np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(nEdges,))
+	offset += 8*nEdges
+	src = np.memmap(path, dtype="<i4", mode="r", offset=offset, shape=(nEdges,))
+	offset += 4*nEdges
+	dst = np.memmap(path, dtype="<i4", mode="r", offset=offset, shape=(nEdges,))
+	return WeightedEdgelist(nodes, src, dst, weight)
+
+# Reads a weighted edgelist in either format from a path or an open file
+#  (e.g. sys.stdin).  Files are recognized by content, not extension.
+def readEdgelist(source):
+	if hasattr(source, "read"):
+		data = source.read()
+		if data.startswith(MAGIC):
+			return parseBinary(data)
+		return parseText(data)
+
+	if isBinary(source):
+		return readBinary(source)
+	return parseText(open(source).read())
+
+def writeBinary(el, path):
+	names = "\n".join(el.nodes)
+	with open(path, "wb") as f:
+		f.write(HEADER.pack(MAGIC, len(el.nodes), len(el), len(names)))
+		f.write(np.asarray(el.weight, dtype="<f8").tostring())
+		f.write(np.asarray(el.src, dtype="<i4").tostring())
+		f.write(np.asarray(el.dst, dtype="<i4").tostring())
+		f.write(names)
+
+# Writes tab-separated text; weights use repr() so they round-trip exactly
+def writeText(el, out):
+	nodes = el.nodes.tolist()
+	out.write("".join("%s\t%s\t%r\n" % (nodes[u], nodes[v], w) for u, v, w in zip(el.src.tolist(), el.dst.tolist(), el.weight.tolist())))
+
+# Iteration order of a dict whose keys were inserted as names[ids], in the
+#  order given.  Inserting the same keys in the same order reproduces the
+#  order of any dict built that way (e.g. by networkx), so scripts that
+#  used to print dicts keep their output order.
+def dictOrder(names, ids):
+	return np.array(dict(zip(names[ids].tolist(), ids.tolist())).values(), dtype=np.int64)
+
+# Undirected adjacency in compressed sparse row form.  The neighbors of node
+#  i are indices[indptr[i]:indptr[i+1]], with edge weights in the same
+#  positions of weight.  As in a networkx Graph, a repeated edge keeps its
+#  last weight but its first position, self-loops are stored once, and
+#  every node's neighbors are listed in the order they were added.
+class Adjacency:
+	def __init__(self, el):
+		nNodes = len(el.nodes)
+		src = np.asarray(el.src, dtype=np.int64)
+		dst = np.asarray(el.dst, dtype=np.int64)
+		keys = np.minimum(src, dst)*nNodes + np.maximum(src, dst)
+
+		# First and last occurrence of every distinct edge (both sorted by key)
+		first = np.unique(keys, return_index=True)[1]
+		last = len(keys) - 1 - np.unique(keys[::-1], return_index=True)[1]
+
+		u = src[first]
+		v = dst[first]
+		weight = np.asarray(el.weight, dtype=np.float64)[last]
+		loop = u == v
+
+		rows = np.concatenate([u, v[~loop]])
+		cols = np.concatenate([v, u[~loop]])
+		added = np.concatenate([first, first[~loop]])
+		order = np.lexsort((added, rows))
+
+		self.nodes = el.nodes
+		self.indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=nNodes))])
+		self.indices = cols[order]
+		self.weight = np.concatenate([weight, weight[~loop]])[order]
+
+	def __len__(self):
+		return len(self.nodes)
+
+	def degree(self):
+		return np.diff(self.indptr)
+
+	# Node ID of every adjacency entry (the row of the CSR matrix)
+	def rows(self):
+		return np.repeat(np.arange(len(self.nodes)), self.degree())
+
+	def nodeIndex(self):
+		return dict(zip(self.nodes.tolist(), xrange(len(self.nodes))))
+
+	# Order in which networkx iterates the nodes of the equivalent Graph
+	#  (G.nodes_iter(), G.adj); both are dicts filled in order of first
+	#  appearance
+	def graphNodeOrder(self):
+		return dictOrder(self.nodes, np.arange(len(self.nodes)))
+
+	# Adjacency positions of the neighbors of node i, in the order networkx
+	#  iterates them (G.neighbors(i))
+	def graphNeighborOrder(self, i):
+		start, end = self.indptr[i], self.indptr[i+1]
+		return start + dictOrder(self.nodes[self.indices[start:end]], np.arange(end - start))
+
+	# Adjacency positions of the edges, oriented and ordered as networkx
+	#  yields them from G.edges_iter()
+	def graphEdgeOrder(self):
+		seen = np.zeros(len(self.nodes), dtype=bool)
+		positions = []
+		for i in self.graphNodeOrder().tolist():
+			nbrs = self.graphNeighborOrder(i)
+			positions.append(nbrs[~seen[self.indices[nbrs]]])
+			seen[i] = True
+		return np.concatenate(positions) if positions else np.zeros(0, dtype=np.int64)
+
+	# Weight of the edge between nodes u and v for arrays of node IDs; pairs
+	#  that are not adjacent raise KeyError
+	def edgeWeights(self, u, v):
+		nNodes = len(self.nodes)
+		keys = self.rows()*nNodes + self.indices
+		order = np.argsort(keys)
+		query = np.asarray(u, dtype=np.int64)*nNodes + np.asarray(v, dtype=np.int64)
+		pos = np.minimum(np.searchsorted(keys[order], query), max(len(keys) - 1, 0))
+		found = keys[order][pos] == query if len(keys) > 0 else np.zeros(len(query), dtype=bool)
+		if not found.all():
+			missing = np.flatnonzero(~found)[0]
+			raise KeyError("%s %s" % (self.nodes[u[missing]], self.nodes[v[missing]]))
+		return self.weight[order[pos]]
+
+# Dense networks (e.g. all-pairs residue distances) are stored as a square
+#  float32 .npy matrix, indexed like the node names listed one per line in
+#  a companion file (NAME.npy -> NAME.nodes)
+def denseNodesPath(path):
+	return (path[:-len(".npy")] if path.endswith(".npy") else path) + ".nodes"
+
+def isDense(path):
+	with open(path, "rb") as f:
+		return f.read(6) == "\x93NUMPY"
+
+def writeDense(nodes, matrix, path):
+	np.save(path, np.asarray(matrix, dtype=np.float32))
+	with open(denseNodesPath(path), "w") as f:
+		f.write("".join(name + "\n" for name in nodes))
+
+# Memory-maps a dense network as (nodes, matrix); only the entries that are
+#  used are read from disk
+def readDense(path):
+	with open(denseNodesPath(path)) as f:
+		nodes = np.array(f.read().splitlines(), dtype=str)
+	return nodes, np.load(path, mmap_mode="r")
+
+# Builds a networkx Graph, adding edges in file order exactly as
+#  read_weighted_edgelist would.  networkx is imported here so that
+#  NumPy-only users of this module do not pay for it.
+def toGraph(el):
+	import networkx as nx
+
+	nodes = el.nodes.tolist()
+	G = nx.Graph()
+	G.add_weighted_edges_from((nodes[u], nodes[v], w) for u, v, w in zip(el.src.tolist(), el.dst.tolist(), el.weight.tolist()))
+	return G
+
+# Drop-in replacement for networkx.read_weighted_edgelist that also accepts
+#  binary containers
+def readGraph(source):
+	import networkx as nx
+
+	if hasattr(source, "read"):
+		data = source.read()
+		if data.startswith(MAGIC):
+			return toGraph(parseBinary(data))
+		return nx.read_weighted_edgelist(io.BytesIO(data))
+
+	if isBinary(source):
+		return toGraph(readBinary(source))
+	return nx.read_weighted_edgelist(source)
@@ -10,42 +10,29 @@
 # network outputting them to stdout in tab-separated format
 
 import sys
-from scipy import stats
-import networkx as nx
-		
-def normalizeEdges(G):
-	minWeight=1000000
-	maxWeight=-1000000
-	
-	for e1, e2 in G.edges_iter():
-		if G[e1][e2]['weight'] < minWeight:
-			minWeight = G[e1][e2]['weight']
-		if G[e1][e2]['weight'] > maxWeight:
-			maxWeight = G[e1][e2]['weight']
-	
-	scaleFactor = 1.0 / (maxWeight - minWeight)
-	
-	for e1, e2 in G.edges_iter():
-		G[e1][e2]['weight'] -= minWeight
-		G[e1][e2]['weight'] *= scaleFactor
+import argparse
+import edgelistIO
+import nodeStats
 		
 #Main body
 def main():
-	if len(sys.argv) != 2: 
-		sys.exit("Usage: [Weighted edgelist]")
+	parser = argparse.ArgumentParser(description="Eigenvector centrality of every node of a weighted edgelist")
+	parser.add_argument("path", help="Weighted edgelist")
+	parser.add_argument("--tol", type=float, default=0, help="Relative accuracy of the eigenvector for large (sparse) networks; 0 means machine precision (default: 0)")
+	args = parser.parse_args()
 
 	#Read arguments
-	path=sys.argv[1]
+	path=args.path
 	
 	#Read the graph
-	G=nx.read_weighted_edgelist(path)
+	adj=edgelistIO.Adjacency(edgelistIO.readEdgelist(path))
 				
-	#Normalized edges to [0,1]
-	normalizeEdges(G)
-	
-	# Calculate EVC
-	evcent=nx.eigenvector_centrality(G);
-	for node in evcent:
-		 sys.stdout.write(str(node) + "\t" + str(evcent[node]) + "\n")
+	# Calculate EVC on edges normalized to [0,1]
+	try:
+		evcent=nodeStats.eigenvectorCentrality(adj, args.tol)
+	except ZeroDivisionError as e:
+		sys.stderr.write("Error: %s\n" % e)
+		exit(1)
+	sys.stdout.write(nodeStats.formatNodeValues(adj, evcent, adj.graphNodeOrder()))
 	
 main()
\ No newline at end of file
@@ -6,50 +6,187 @@
 # University of Kansas Medical Center
 # 2012-10-10
 
+# Writes the minimum interatomic distance between every pair of residues of
+#   the allowed chains of a PDB file as a weighted edgelist.  Residues are
+#   identified by residue number and insertion code (chains sharing a
+#   numbering are merged).
+#
+# Status: Complete
+# Version: 2.0
+# Language: Python
+# Changelog:
+#    + 2012-10-10: Created
+#    + 2026-10-18: Replaced the per-pair Python distance loops with a NumPy
+#                   engine (atoms grouped into residue segments, blocked
+#                   distance kernels); added --cutoff, which finds contacts
+#                   with a k-d tree and writes only residue pairs within it
+#    + 2026-10-18: Reads atoms with the shared (cached) pdbIO parser
+#    + 2026-10-18: Added --matrix, which writes a memory-mappable dense
+#                   distance matrix for measureScoreVsDistance.py
+
 import sys
+import argparse
 import numpy as np
-import scipy as sp
-import scipy.linalg
-from scipy import stats
-import networkx as nx
-import itertools
-import math
-
-def minDist(list1, list2):
-	return min([dist(x,y) for x,y in itertools.product(list1, list2)])
-
-def dist(x, y):
-	return math.sqrt((x[0] - y[0])**2 + (x[1] - y[1])**2 + (x[2] - y[2])**2)
+import scipy.spatial
+import edgelistIO
+import pdbIO
+
+# Residue blocks of the dense distance kernel are sized so that a block of
+#  the atom-atom distance matrix has at most this many entries
+BLOCK_ENTRIES = 4000000
+
+# Atoms of a structure grouped by residue.  The atoms of residue r are
+#  xyz[offsets[r]:offsets[r+1]]; residues are numbered in order of first
+#  appearance.
+class ResidueAtoms:
+	def __init__(self, residues, xyz, offsets):
+		self.residues = residues
+		self.xyz = xyz
+		self.offsets = offsets
 	
-def print_weighted_edgelist(G):
-	print "\n".join(["\t".join(map(str,[v1, v2, G[v1][v2]['weight']])) for v1, v2 in G.edges_iter()])
+	def __len__(self):
+		return len(self.residues)
+
+	# Residue number of every atom
+	def atomResidues(self):
+		return np.repeat(np.arange(len(self.residues)), np.diff(self.offsets))
+
+def readResidueAtoms(pdbPath, allowedChains):
+	pdbRecords = pdbIO.selectAtoms(pdbIO.readAtoms(pdbPath), ["ATOM  "], allowedChains)
+	if len(pdbRecords) == 0:
+		return ResidueAtoms(np.array([], dtype=str), np.zeros((0, 3)), np.zeros(1, dtype=np.int64))
+
+	residues, ids = edgelistIO.internNodes(pdbRecords["resSeq"])
+	order = np.argsort(ids, kind="mergesort")
+	offsets = np.concatenate([[0], np.cumsum(np.bincount(ids))])
+	return ResidueAtoms(residues, pdbRecords["xyz"][order], offsets)
+
+# Squared distances between every point of a and every point of b, summed
+#  as (dx^2 + dy^2) + dz^2 like the scalar code so that results agree to
+#  the last bit
+def squaredDistances(a, b):
+	d = a[:, np.newaxis, 0] - b[np.newaxis, :, 0]
+	d2 = d*d
+	for axis in (1, 2):
+		d = a[:, np.newaxis, axis] - b[np.newaxis, :, axis]
+		d2 += d*d
+	return d2
+
+# Squared distances between corresponding rows of a and b
+def pairedSquaredDistances(a, b):
+	d = a - b
+	d2 = d*d
+	return (d2[:, 0] + d2[:, 1]) + d2[:, 2]
+
+# Minimum distance between every pair of residues as a dense matrix.  Rows
+#  are processed in blocks of residues; the atom-atom distances of a block
+#  are reduced to residues along both axes with np.minimum.reduceat.
+def minDistanceMatrix(atoms):
+	nResidues = len(atoms)
+	offsets = atoms.offsets
+	minDist2 = np.empty((nResidues, nResidues))
+	blockAtoms = max(BLOCK_ENTRIES // max(len(atoms.xyz), 1), 1)
+
+	start = 0
+	while start < nResidues:
+		end = max(np.searchsorted(offsets, offsets[start] + blockAtoms, side="right") - 1, start + 1)
+		d2 = squaredDistances(atoms.xyz[offsets[start]:offsets[end]], atoms.xyz)
+		d2 = np.minimum.reduceat(d2, offsets[:-1], axis=1)
+		minDist2[start:end] = np.minimum.reduceat(d2, offsets[start:end] - offsets[start], axis=0)
+		start = end
+
+	return np.sqrt(minDist2)
+
+# Residue pairs (r1 <= r2) whose minimum distance is at most cutoff, with
+#  that distance.  Atom pairs within the cutoff are found with a k-d tree;
+#  every residue is paired with itself at distance 0.
+def contactPairs(atoms, cutoff):
+	nResidues = len(atoms)
+	residue = atoms.atomResidues()
+	pairs = scipy.spatial.cKDTree(atoms.xyz).query_pairs(cutoff, output_type="ndarray").reshape(-1, 2)
+
+	r1 = residue[pairs[:, 0]]
+	r2 = residue[pairs[:, 1]]
+	lo = np.minimum(r1, r2)
+	hi = np.maximum(r1, r2)
+	dist = np.sqrt(pairedSquaredDistances(atoms.xyz[pairs[:, 0]], atoms.xyz[pairs[:, 1]]))
+
+	# Closest atom pair of every residue pair
+	keys = lo*nResidues + hi
+	order = np.lexsort((dist, keys))
+	first = order[np.concatenate([[True], keys[order][1:] != keys[order][:-1]])] if len(order) else order
+	first = first[(dist[first] <= cutoff) & (lo[first] != hi[first])]
+
+	self = np.arange(nResidues)
+	return np.concatenate([lo[first], self]), np.concatenate([hi[first], self]), np.concatenate([dist[first], np.zeros(nResidues)])
+
+# Order in which the networkx Graph of the original implementation listed
+#  its nodes: residues went through a set, then a dict built from it, then
+#  the graph's adjacency dict
+def graphResidueOrder(residues):
+	index = dict(zip(residues.tolist(), xrange(len(residues))))
+	setOrder = np.array([ index[r] for r in set(residues.tolist()) ], dtype=np.int64)
+	return edgelistIO.dictOrder(residues, edgelistIO.dictOrder(residues, setOrder))
+
+# Residue names and the residue pairs with their minimum distances, as
+#  (residues, residue1, residue2, distance) arrays.  Pairs are oriented and
+#  ordered as the networkx implementation wrote them: every pair once,
+#  including self-pairs.  With a cutoff, only pairs within cutoff Angstroms
+#  are included.
+def getDistanceNetwork(pdbPath, allowedChains, cutoff=None):
+	atoms = readResidueAtoms(pdbPath, allowedChains)
+	order = graphResidueOrder(atoms.residues)
+	position = np.empty(len(order), dtype=np.int64)
+	position[order] = np.arange(len(order))
+
+	if cutoff is None:
+		dist = minDistanceMatrix(atoms)
+		rows, cols = np.triu_indices(len(order))
+		r1, r2 = order[rows], order[cols]
+		return atoms.residues, r1, r2, dist[r1, r2]
+
+	lo, hi, dist = contactPairs(atoms, cutoff)
+	swap = position[lo] > position[hi]
+	r1 = np.where(swap, hi, lo)
+	r2 = np.where(swap, lo, hi)
+	ranked = np.lexsort((position[r2], position[r1]))
+	return atoms.residues, r1[ranked], r2[ranked], dist[ranked]
+
+# Residue names and the minimum distance between every pair of residues as
+#  a dense matrix in the same order.  With a cutoff, pairs farther apart
+#  are NaN.
+def getDistanceMatrix(pdbPath, allowedChains, cutoff=None):
+	atoms = readResidueAtoms(pdbPath, allowedChains)
+	if cutoff is None:
+		return atoms.residues, minDistanceMatrix(atoms)
+
+	lo, hi, dist = contactPairs(atoms, cutoff)
+	matrix = np.full((len(atoms), len(atoms)), np.nan)
+	matrix[lo, hi] = dist
+	matrix[hi, lo] = dist
+	return atoms.residues, matrix
+
+def print_weighted_edgelist(residues, r1, r2, dist):
+	names = residues.tolist()
+	sys.stdout.write("\n".join([ "\t".join([ names[v1], names[v2], str(w) ]) for v1, v2, w in zip(r1.tolist(), r2.tolist(), dist.tolist()) ]) + "\n")
 
 #Main body
 def main_generate_contact_network():
-	if len(sys.argv) != 3: 
-		sys.exit("Usage: [PDB Atoms Path] [Allowed chains]")
-
-	pdbPath=sys.argv[1]
-	allowedChains = sys.argv[2]
-		
-	distNet = getDistanceNetwork(pdbPath, allowedChains)
-			
-	print_weighted_edgelist(distNet)
+	parser = argparse.ArgumentParser(description="Minimum distance between residues of a PDB file as a weighted edgelist")
+	parser.add_argument("pdbPath", help="PDB Atoms Path")
+	parser.add_argument("allowedChains", help="Allowed chains (e.g. AB)")
+	parser.add_argument("--cutoff", type=float, default=None, help="Only write residue pairs within this distance (Angstroms)")
+	parser.add_argument("--matrix", default=None, help="Instead of the edgelist, write a float32 residue x residue distance matrix to this .npy file (residue IDs go to NAME.nodes); pairs beyond --cutoff are NaN")
+	args = parser.parse_args()
 
-def getDistanceNetwork(pdbPath, allowedChains):
-	chainDict = { c : 1 for c in allowedChains }
+	if args.matrix is not None:
+		residues, matrix = getDistanceMatrix(args.pdbPath, args.allowedChains, args.cutoff)
+		edgelistIO.writeDense(residues.tolist(), matrix, args.matrix)
+		return
 
-	pdbRecords = [ [ line[22:27].strip(), tuple(map(float,[line[30:38], line[38:46], line[46:54]])) ] for line in open(pdbPath) if line[0:4]=="ATOM" and line[21:22] in chainDict ]
-	allAtoms = set([record[0] for record in pdbRecords])
-	
-	distNet = nx.Graph()
-
-	atomGroups = { atom: [ record[1] for record in pdbRecords if record[0]==atom ] for atom in allAtoms }
-	for atom1 in atomGroups:
-		for atom2 in atomGroups:
-			distNet.add_edge(atom1, atom2, weight=minDist(atomGroups[atom1], atomGroups[atom2]))
-			
-	return distNet	
+	residues, r1, r2, dist = getDistanceNetwork(args.pdbPath, args.allowedChains, args.cutoff)
+		
+	print_weighted_edgelist(residues, r1, r2, dist)
 
 def main():
 	main_generate_contact_network()
@@ -8,7 +8,7 @@
 # Extracts all edge data associated with a particular node
 #
 # Status: Complete and spot-tested
-# Version: 1.1
+# Version: 1.2
 # Language: Python
 # Changelog:
 #    + 2013-01-08: Created
@@ -16,9 +16,12 @@
 #    + 2013-01-08: Modified to perform a more detailed ordering.  Looking at maximum node
 #                   first, but in cases of ties (which often occur, since edges belong to
 #                   two different nodes), look to the next-highest score, etc...
+#    + 2026-10-18: Reads the network with edgelistIO instead of networkx;
+#                   output is unchanged
 
 import sys;
-import networkx as nx;
+import numpy as np;
+import edgelistIO;
 
 def usage():
 	sys.stderr.write("Usage: cat myWel.wel | extractNodeData [Node Identifier]\n")
@@ -33,19 +36,22 @@ def main():
 		errorOut("Not enough arguments", 255)
 
 	# Read the weighted edgelist
-	G = nx.read_weighted_edgelist(sys.stdin)
+	adj = edgelistIO.Adjacency(edgelistIO.readEdgelist(sys.stdin))
 	
 	nid = sys.argv[1]
+	nodeIndex = adj.nodeIndex()
+	if nid not in nodeIndex:
+		errorOut("Node %s is not in the network\n" % nid, 1)
 
 	# Get edge weights
-	weights = [ (nid, n2, G[nid][n2]['weight']) for n2 in G.neighbors(nid)  ]
+	neighbors = adj.graphNeighborOrder(nodeIndex[nid])
 	
-	# Sort nodes in decending order
-	weights.sort(key=lambda x : x[2], reverse=True)
+	# Sort nodes in decending order (stable, so ties keep neighbor order)
+	neighbors = neighbors[np.argsort(-adj.weight[neighbors], kind='mergesort')]
 	
 	# Write nodes and maxWeights out with UNIX-style line endings
-	for t in weights:
-		sys.stdout.write("%s\t%s\t%f\n" % t )
+	weights = zip(adj.nodes[adj.indices[neighbors]].tolist(), adj.weight[neighbors].tolist())
+	sys.stdout.write("".join("%s\t%s\t%f\n" % (nid, n2, w) for n2, w in weights))
 
 main()
 
@@ -5,19 +5,24 @@
 # Swint-Kruse Laboratory
 # University of Kansas Medical Center
 
+# Converts a FASTA alignment (stdin) to Fodor format (stdout), one record at
+# a time
+#
+# Changelog:
+#    + 2026-10-18: Streams records with fastaIO instead of Bio.SeqIO
+
 import sys
 import re
-import Bio.SeqIO
+import fastaIO
 
 # Strips whitespace from name (replace with underscore)
 def safeName(name):
 	return str(re.sub(r"\s+", "_", name))
 
 def main():
-	msa = list(Bio.SeqIO.parse(sys.stdin, "fasta"))
+	msa = fastaIO.readFasta(sys.stdin)
 	
-	for x in msa:
-		sys.stdout.write(safeName(x.name) + " " + str(x.seq) + "\n")
+	fastaIO.writeFodor(sys.stdout, ((safeName(name), seq) for name, seq in msa))
 	
 
 if __name__ == '__main__':
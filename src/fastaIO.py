@@ -0,0 +1,75 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Streaming reading and writing of alignments in FASTA format and in Fodor
+# format ("IDENTIFIER (spaces) ALIGNMENT", one sequence per line), without
+# Biopython.  Readers are generators of (name, sequence) string pairs, so
+# only one record is held in memory at a time; writers collect records into
+# large blocks before writing them.
+#
+# FASTA records are read as Bio.SeqIO reads them: text before the first
+# '>' is skipped, the name is the first word of the title line and the
+# sequence lines are joined with all spaces and carriage returns removed.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+
+# Records collected before each write
+WRITE_BLOCK = 4096
+
+# First word of a FASTA title line, or "" for an empty title
+def titleName(title):
+	words = title.split(None, 1)
+	return words[0] if words else ""
+
+def readFasta(stream):
+	name = None
+	lines = []
+	for line in stream:
+		if line[0] == ">":
+			if name is not None:
+				yield name, "".join(lines).replace(" ", "").replace("\r", "")
+			name = titleName(line[1:].rstrip())
+			lines = []
+		elif name is not None:
+			lines.append(line.rstrip())
+
+	if name is not None:
+		yield name, "".join(lines).replace(" ", "").replace("\r", "")
+
+# Reads Fodor format; blank lines are skipped
+def readFodor(stream):
+	for line in stream:
+		fields = line.split(None, 1)
+		if fields:
+			yield fields[0], fields[1].strip() if len(fields) > 1 else ""
+
+# Writes an iterable of text blocks in batches of WRITE_BLOCK
+def writeBlocks(out, blocks):
+	batch = []
+	for block in blocks:
+		batch.append(block)
+		if len(batch) >= WRITE_BLOCK:
+			out.write("".join(batch))
+			batch = []
+	out.write("".join(batch))
+
+def wrap(seq, width):
+	return "\n".join(seq[i:i+width] for i in xrange(0, len(seq), width))
+
+# Writes FASTA records; sequences are wrapped at width columns, or written
+#  on one line if width is None
+def writeFasta(out, records, width=None):
+	if width is None:
+		writeBlocks(out, (">%s\n%s\n" % (name, seq) for name, seq in records))
+	else:
+		writeBlocks(out, (">%s\n%s\n" % (name, wrap(seq, width)) for name, seq in records))
+
+def writeFodor(out, records):
+	writeBlocks(out, ("%s %s\n" % (name, seq) for name, seq in records))
@@ -6,25 +6,103 @@
 # University of Kansas Medical Center
 
 import sys
-import Bio.SeqIO
+import struct
+import hashlib
+import argparse
+import itertools
+import numpy as np
+import fastaIO
 
 # Filters a FASTA-formatted alignment (to stdin), retaining sequences
 # only if the (ungapped) sequence occurs in the alignment specified
 # as argument 1
+#
+# For very large alignments, --digests keeps only a 16-byte MD5 digest of
+# each ungapped include sequence instead of the sequence itself, and
+# --save-index/--index store and reload those digests as a sorted binary
+# file:
+#    header  : 8-byte magic, int64 number of digests
+#    digests : sorted 16-byte digests
+#
+# Changelog:
+#    + 2026-10-18: Streams stdin with fastaIO instead of Bio.SeqIO
+#    + 2026-10-18: Added the digest index (--digests, --save-index, --index)
 
 def chomp(line):
 	return line.rstrip("\n").rstrip("\r")
 
+INDEX_MAGIC = "CEDIG\x00\x01\x00"
+INDEX_HEADER = struct.Struct("<8sq")
+DIGEST_DTYPE = "S16"
+
+def digest(seq):
+	return hashlib.md5(seq.replace("-","")).digest()
+
+# Sorted, distinct digests of the ungapped sequences of a FASTA file
+def buildIndex(path):
+	digests = "".join(digest(seq) for name, seq in fastaIO.readFasta(open(path)))
+	return np.unique(np.frombuffer(digests, dtype=DIGEST_DTYPE))
+
+def saveIndex(index, path):
+	with open(path, "wb") as f:
+		f.write(INDEX_HEADER.pack(INDEX_MAGIC, len(index)))
+		f.write(index.tostring())
+
+def loadIndex(path):
+	data = open(path, "rb").read()
+	magic, count = INDEX_HEADER.unpack_from(data)
+	if magic != INDEX_MAGIC:
+		sys.exit("Not a sequence digest index: %s" % path)
+	return np.frombuffer(data, dtype=DIGEST_DTYPE, count=count, offset=INDEX_HEADER.size)
+
+# Records whose ungapped sequence is in the index.  Records are digested
+#  and looked up in blocks, with one np.searchsorted per block.
+def filterByIndex(msa, index):
+	while True:
+		block = list(itertools.islice(msa, fastaIO.WRITE_BLOCK))
+		if not block:
+			return
+		if len(index) == 0:
+			continue
+		
+		digests = np.frombuffer("".join(digest(seq) for name, seq in block), dtype=DIGEST_DTYPE)
+		pos = np.minimum(np.searchsorted(index, digests), len(index) - 1)
+		for record, found in zip(block, (index[pos] == digests).tolist()):
+			if found:
+				yield record
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Retains sequences of a FASTA alignment (stdin) whose ungapped sequence occurs in another alignment")
+	parser.add_argument("include", nargs="?", help="FASTA alignment of the sequences to retain")
+	parser.add_argument("--digests", action="store_true", help="Compare sequence digests instead of whole sequences (less memory)")
+	parser.add_argument("--save-index", help="Write the digest index of the include alignment to this file and exit")
+	parser.add_argument("--index", help="Read the digests to retain from an index written by --save-index")
+	args = parser.parse_args()
+	if (args.include is None) == (args.index is None):
+		parser.error("Give either an include alignment or --index")
+	if args.save_index is not None and args.include is None:
+		parser.error("--save-index requires an include alignment")
+	return args
+
 def main():
-	includeMSA = list(Bio.SeqIO.parse(sys.argv[1], "fasta"))
-	includeDict = { str(x.seq).replace("-","") : 0 for x in includeMSA }
+	args = parseArgs()
+	
+	if args.save_index is not None:
+		saveIndex(buildIndex(args.include), args.save_index)
+		return
+	
+	msa = fastaIO.readFasta(sys.stdin)
 	
-	msa = list(Bio.SeqIO.parse(sys.stdin, "fasta"))
-	msa = [x for x in msa if str(x.seq).replace("-","") in includeDict]
+	if args.index is not None:
+		msa = filterByIndex(msa, loadIndex(args.index))
+	elif args.digests:
+		msa = filterByIndex(msa, buildIndex(args.include))
+	else:
+		includeMSA = fastaIO.readFasta(open(args.include))
+		includeDict = { seq.replace("-","") : 0 for name, seq in includeMSA }
+		msa = ((name, seq) for name, seq in msa if seq.replace("-","") in includeDict)
 	
-	for x in msa:
-		print ">" + x.name
-		print x.seq
+	fastaIO.writeFasta(sys.stdout, msa)
 	
 
 if __name__=='__main__':
@@ -0,0 +1,27 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Converts a file in the format:
+# IDENTIFIER (spaces) ALIGNMENT
+# into fasta format for proteins (sequences wrapped at 60 columns), one
+# record at a time
+#
+# Input from standard input and output to standard output
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created to replace the sed/perl pipeline of fodor2fasta.sh
+
+import sys
+import fastaIO
+
+def main():
+	fastaIO.writeFasta(sys.stdout, fastaIO.readFodor(sys.stdin), 60)
+
+if __name__ == '__main__':
+	main()
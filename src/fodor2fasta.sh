@@ -10,6 +10,9 @@
 # into fasta format for proteins
 #
 # Input from standard input and output to standard output
+#
+# The conversion is done by fodor2fasta.py, which streams records and
+# handles DOS line endings itself
 
-dos2unix | sed 's/\([^ ]*\) *\([^ ]*\)/>\1\n\2/g' | perl -pe 's/(.{60,60}(?!$))/\1\n/g if not /^>/;' < /dev/stdin
+exec "`dirname $0`/fodor2fasta.py"
 
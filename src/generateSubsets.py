@@ -0,0 +1,106 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Generates N random subsets of the sequences of a Fodor-format alignment,
+# as generate_subsets.sh did, but reads the alignment only once.  Every
+# subset is drawn without replacement as an array of row indices into the
+# loaded alignment and written in Fodor format to
+#    OUT/fodor/NNNN_SIZE_BASE.subset.aligned.fodor
+# and in FASTA format (as fodor2fasta.sh writes it) to
+#    OUT/fasta/NNNN_SIZE_BASE.subset.aligned.fasta
+# where BASE is the input name without ".aligned.fodor".
+#
+# Subsets are reproducible with --seed; without it a seed is drawn and
+# reported on standard error.  Scoring code can skip the files entirely:
+#    names, seqs = generateSubsets.readAlignment(path)
+#    for rows in generateSubsets.sampleSubsets(len(seqs), size, count, seed):
+#        scores = znmi.scoreAlignment(znmi.encodeAlignment(seqs[rows].tolist()))
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created to replace generate_subsets.sh
+
+import os
+import sys
+import argparse
+import numpy as np
+import fastaIO
+
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
+
+# Names and sequences of a Fodor-format alignment as arrays, so that subsets
+#  are taken by indexing
+def readAlignment(path):
+	with open(path) as f:
+		records = list(fastaIO.readFodor(f))
+	if not records:
+		errorOut("No sequences in %s\n" % path, 1)
+	names, seqs = zip(*records)
+	return np.array(names), np.array(seqs)
+
+# Row indices of count subsets of size records each, drawn without
+#  replacement (in random order, like "sort -R | head").  A subset larger
+#  than the alignment holds every record.
+def sampleSubsets(nRecords, size, count, seed=None):
+	rng = np.random.RandomState(seed)
+	size = min(size, nRecords)
+	return [ rng.permutation(nRecords)[:size] for i in xrange(count) ]
+
+def subsetName(index, size, baseName):
+	return "%04d_%d_%s.subset.aligned" % (index, size, baseName)
+
+# Writes every subset in the requested formats ("fodor", "fasta")
+def writeSubsets(outDir, baseName, size, names, seqs, subsets, formats):
+	for fmt in formats:
+		if not os.path.isdir(os.path.join(outDir, fmt)):
+			os.makedirs(os.path.join(outDir, fmt))
+
+	for index, rows in enumerate(subsets):
+		records = zip(names[rows].tolist(), seqs[rows].tolist())
+		name = subsetName(index, size, baseName)
+		if "fodor" in formats:
+			with open(os.path.join(outDir, "fodor", name + ".fodor"), "w") as out:
+				fastaIO.writeFodor(out, records)
+		if "fasta" in formats:
+			with open(os.path.join(outDir, "fasta", name + ".fasta"), "w") as out:
+				fastaIO.writeFasta(out, records, 60)
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Random subsets of the sequences of a Fodor-format alignment")
+	parser.add_argument("inputFile", help="Alignment in Fodor format (e.g. NAME.aligned.fodor)")
+	parser.add_argument("subsetSize", type=int, help="Sequences per subset")
+	parser.add_argument("numSubsets", type=int, help="Number of subsets to create")
+	parser.add_argument("--seed", type=int, default=None, help="Seed of the random number generator (default: drawn and reported on standard error)")
+	parser.add_argument("--out-dir", default="subsets", help="Directory under which fodor/ and fasta/ are written (default: subsets)")
+	parser.add_argument("--formats", nargs="+", choices=["fodor", "fasta"], default=["fodor", "fasta"], help="Formats to write (default: fodor fasta)")
+	args = parser.parse_args()
+	if args.subsetSize < 1 or args.numSubsets < 0:
+		parser.error("subsetSize must be positive and numSubsets non-negative")
+	return args
+
+#Main body
+def main():
+	args = parseArgs()
+
+	seed = args.seed
+	if seed is None:
+		seed = np.random.randint(2**31 - 1)
+		sys.stderr.write("Subset seed: %d\n" % seed)
+
+	names, seqs = readAlignment(args.inputFile)
+	subsets = sampleSubsets(len(seqs), args.subsetSize, args.numSubsets, seed)
+
+	baseName = os.path.basename(args.inputFile)
+	if baseName.endswith(".aligned.fodor"):
+		baseName = baseName[:-len(".aligned.fodor")]
+	writeSubsets(args.out_dir, baseName, args.subsetSize, names, seqs, subsets, args.formats)
+
+if __name__ == '__main__':
+	main()
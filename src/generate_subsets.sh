@@ -8,21 +8,10 @@
 # Generates N subsets of an input file
 #
 # Status of this file: Operational; 20 June 2011
+#
+# Usage: generate_subsets.sh [input file] [subset size] [num subsets]
+#
+# Subsets are drawn by generateSubsets.py, which reads the input only once;
+# as before, only subsets/fodor is written
 
-# Read input data
-input_file=$1;
-num_in_subset=$2;
-num_to_create=$3;
-
-create_less_one=`expr $num_to_create - 1`;
-
-# Make the output directory
-outputDir="subsets/fodor/"
-mkdir -p $outputDir;
-
-baseInputName=`basename $input_file .aligned.fodor`;
-
-for i in `seq 0 $create_less_one`;
-do 
-	sort $1 -R | head -n $num_in_subset > $outputDir`printf %04d $i`_$num_in_subset"_"$baseInputName.subset.aligned.fodor;
-done
\ No newline at end of file
+exec "`dirname $0`/generateSubsets.py" "$1" "$2" "$3" --formats fodor
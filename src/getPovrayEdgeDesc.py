@@ -9,24 +9,23 @@
 # trace of the structure
 #
 # Status: Complete
-# Version: 1.0
+# Version: 1.1
 # Language: Python
 # Changelog:
 #    + 2013-07-11: Created
+#    + 2026-10-18: Reads residue descriptors with the shared (cached) pdbIO
+#                   loader
 
 import sys
 import math
 import itertools
+import pdbIO
 
 class Residue:
-	def __init__(self, descStr):
-		fields = descStr.strip().split('\t')
-		if len(fields) != 7:
-			raise ValueError('Wrong number of fields in a residue descriptor string')
-		
-		self.lac = str(fields[0])
-		self.a = Point3D(fields[1], fields[2], fields[3])
-		self.b = Point3D(fields[4], fields[5], fields[6])
+	def __init__(self, lac, a, b):
+		self.lac = str(lac)
+		self.a = Point3D(a[0], a[1], a[2])
+		self.b = Point3D(b[0], b[1], b[2])
 		
 	def __repr__(self):
 		return "Residue " + self.lac + " at " + str(self.a) + " and " + str(self.b)
@@ -227,7 +226,8 @@ def determinePovLines(structure, edges):
 	
 def main():
 	atomPath = sys.argv[1]
-	residues = [Residue(line) for i, line in enumerate(open(atomPath)) if i > 0]
+	descriptors = pdbIO.readResidueDescriptors(atomPath)
+	residues = [ Residue(lac, a, b) for lac, a, b in zip(descriptors["residue"].tolist(), descriptors["a"].tolist(), descriptors["b"].tolist()) ]
 	edges = [ Edge(line) for line in sys.stdin ]
 	
 	#print "\n".join(map(str,residues))
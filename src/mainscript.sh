@@ -9,15 +9,15 @@
 # Assumptions:
 # That Fodor's java directory is ../covariance1_1_nofilter
 # That ZNMI is in the ./bin directory
-# The AverageNetworkPath program is in the ./bin directory
+# The network averager (averageNetwork.py) and renumbering.py are in the ./scripts directory
 # That a translation file is available in data_files
 
 fodorClassPath="../covariance1_1_nofilter"
 ZNMIPath="./bin/ZNMI.exe"
 ZNDAMIPath="./bin/ZNDAMI.exe"
 translationFile="./data_files/col_to_lac_map.tsv"
-AverageNetworkPath="./bin/AverageNetwork.exe"
-ApplyRenumberingPath="./bin/ApplyRenumbering.exe"
+AverageNetworkPath="./scripts/averageNetwork.py"
+RenumberingPath="./scripts/renumbering.py"
 
 declare -a algorithmName=(elsc omes mcbasc sca)
 declare -a fodorname=(ELSCCovariance OmesCovariance McBASCCovariance JavaSCA)
@@ -46,7 +46,7 @@ do
 		java -classpath "$fodorClassPath" covariance.algorithms.${fodorname[$aIndex]} $i $raw_output;
 		
 		echo "   "Applying filtration and renumbering criteria...
-		tail -n +2 $raw_output | dos2unix | $ApplyRenumberingPath $translationFile 1 | dos2unix | $ApplyRenumberingPath $translationFile 2 > $mapped_output
+		tail -n +2 $raw_output | $RenumberingPath $translationFile > $mapped_output
 	done;
 	
 	echo Averaging the network for ${algorithmName[$aIndex]}
@@ -72,12 +72,12 @@ do
 	gunzip $raw_output.gz
 	
 	echo "   "Applying filtration and renumbering criteria...
-	tail -n +2 $raw_output | dos2unix | $ApplyRenumberingPath $translationFile 1 | dos2unix | $ApplyRenumberingPath $translationFile 2 > $mapped_output
+	tail -n +2 $raw_output | $RenumberingPath $translationFile > $mapped_output
 done;
 	
 echo Averaging the network for znmi
-$AverageNetworkPath mapped_result/znmi/*.map > $avgResultPath
-cat $avgResultPath | grep -e "100$" -e "[6789].$" -e "5[123456789]$" | cut -f1-3 > $avgResultWelPath
+$AverageNetworkPath --min-n 51 mapped_result/znmi/*.map > $avgResultPath
+cut -f1-3 $avgResultPath > $avgResultWelPath
 
 #Perform coevolution analysis for ZNDAMI
 mkdir raw_result/zndami
@@ -97,9 +97,9 @@ do
 	gunzip $raw_output.gz
 	
 	echo "   "Applying filtration and renumbering criteria...
-	tail -n +2 $raw_output | dos2unix | $ApplyRenumberingPath $translationFile 1 | dos2unix | $ApplyRenumberingPath $translationFile 2 > $mapped_output
+	tail -n +2 $raw_output | $RenumberingPath $translationFile > $mapped_output
 done;
 	
 echo Averaging the network for zndami
-$AverageNetworkPath mapped_result/zndami/*.map > $avgResultPath
-cat $avgResultPath | grep -e "100$" -e "[6789].$" -e "5[123456789]$" | cut -f1-3 > $avgResultWelPath
\ No newline at end of file
+$AverageNetworkPath --min-n 51 mapped_result/zndami/*.map > $avgResultPath
+cut -f1-3 $avgResultPath > $avgResultWelPath
\ No newline at end of file
@@ -10,8 +10,8 @@
 # outputting them to stdout in tab-separated format
 
 import sys
-from scipy import stats
-import networkx as nx
+import edgelistIO
+import nodeStats
 
 #Main body
 def main():
@@ -22,13 +22,15 @@ def main():
 	path=sys.argv[1]
 	
 	#Read the graph
-	G=nx.read_weighted_edgelist(path)
+	adj=edgelistIO.Adjacency(edgelistIO.readEdgelist(path))
 		
 	# Calculate the maximum edge weight
-	mew = { node : max([G[node][x]['weight'] for x in G.neighbors(node)]) for node in G.nodes_iter() }
+	mew = nodeStats.maxEdgeWeights(adj)
 		
-	for node in mew:
-		 sys.stdout.write(str(node) + "\t" + str(mew[node]) + "\n")
+	# Nodes are written in the order of the node -> MEW dict that used to be
+	#  filled in graph order
+	order = edgelistIO.dictOrder(adj.nodes, adj.graphNodeOrder())
+	sys.stdout.write(nodeStats.formatNodeValues(adj, mew, order))
 	
 
 	
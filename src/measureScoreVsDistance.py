@@ -7,16 +7,55 @@
 
 # Accepts a co-evolution and distance network as weighted edgelists and annotates the distance
 # for the co-evolving pair
+#
+# The distance network may also be a dense distance matrix written by
+# "extractDistanceNetwork.py --matrix" (NAME.npy with NAME.nodes), which is
+# memory-mapped and shared by every co-evolution network annotated against
+# it; distances are then looked up with a single gather (and printed with
+# float32 precision).
+#
+# Changelog:
+#    + 2026-10-18: Accepts dense (.npy) distance matrices
 
 import sys
-import networkx as nx
+import numpy as np
+import edgelistIO
+
+# Distances of the pairs of named residues in a dense matrix; pairs without
+#  a distance (beyond the cutoff of the matrix) raise KeyError
+def denseDistances(path, names1, names2):
+	residues, matrix = edgelistIO.readDense(path)
+	index = dict(zip(residues.tolist(), xrange(len(residues))))
+	uniq = np.union1d(names1, names2)
+	toDist = np.array([ index[name] for name in uniq.tolist() ], dtype=np.int64)
+	dist = matrix[toDist[np.searchsorted(uniq, names1)], toDist[np.searchsorted(uniq, names2)]]
+	if np.isnan(dist).any():
+		missing = np.flatnonzero(np.isnan(dist))[0]
+		raise KeyError("%s %s" % (names1[missing], names2[missing]))
+	return [ str(d) for d in dist ]
 
 def main():
-	coevnet = nx.read_weighted_edgelist(sys.argv[1])
-	distnet = nx.read_weighted_edgelist(sys.argv[2])
+	coevnet = edgelistIO.Adjacency(edgelistIO.readEdgelist(sys.argv[1]))
+	
+	# Co-evolving edges in the order networkx used to yield them
+	edges = coevnet.graphEdgeOrder()
+	e1 = coevnet.rows()[edges]
+	e2 = coevnet.indices[edges]
+	nodes = coevnet.nodes
+	
+	if edgelistIO.isDense(sys.argv[2]):
+		dist = denseDistances(sys.argv[2], nodes[e1], nodes[e2])
+	else:
+		distnet = edgelistIO.Adjacency(edgelistIO.readEdgelist(sys.argv[2]))
+	
+		# Translate node IDs to those of the distance network
+		distIndex = distnet.nodeIndex()
+		toDist = np.array([ distIndex[name] for name in coevnet.nodes.tolist() ], dtype=np.int64)
+	
+		dist = distnet.edgeWeights(toDist[e1], toDist[e2]).tolist()
 	
-	for e1, e2 in coevnet.edges_iter():
-		print e1, e2, coevnet[e1][e2]['weight'], distnet[e1][e2]['weight']
+	rows = zip(nodes[e1].tolist(), nodes[e2].tolist(), coevnet.weight[edges].tolist(), dist)
+	sys.stdout.write("".join("%s %s %s %s\n" % row for row in rows))
 
 
 main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Column-wise alignment of several weighted edgelists, shared by
+# alignMultiNetworks.py, compositeNetwork.py and subtractNetworks.py.  The
+# union of the edges of all networks is indexed once and the weights are
+# held as an (edges x networks) matrix with NaN for edges a network lacks,
+# so normalization and averaging are whole-matrix NumPy operations.
+#
+# Edges are identified by their sorted (node1, node2) names and listed in
+# the order the original scripts iterated them (the set union of one dict
+# per graph), so their output is unchanged.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+#    + 2026-10-18: Added the orientation-free edge keys and joins used by
+#                   subtractNetworks.py
+
+import numpy as np
+import edgelistIO
+import fastaIO
+
+# Edges of a network as sorted (node1, node2) names, with their weights,
+#  in the order networkx yields them (G.edges_iter())
+def graphEdges(adj):
+	positions = adj.graphEdgeOrder()
+	u = adj.nodes[adj.rows()[positions]]
+	v = adj.nodes[adj.indices[positions]]
+	swap = u > v
+	return np.where(swap, v, u), np.where(swap, u, v), adj.weight[positions]
+
+def readEdges(path):
+	return graphEdges(edgelistIO.Adjacency(edgelistIO.readEdgelist(path)))
+
+# Integer key of every (node1, node2) pair, given the sorted names of all
+#  nodes
+def edgeKeys(names, node1, node2):
+	return np.searchsorted(names, node1).astype(np.int64)*len(names) + np.searchsorted(names, node2)
+
+# Orientation-free integer key of every (node1, node2) pair
+def canonicalEdgeKeys(names, node1, node2):
+	ids1 = np.searchsorted(names, node1).astype(np.int64)
+	ids2 = np.searchsorted(names, node2).astype(np.int64)
+	return np.minimum(ids1, ids2)*len(names) + np.maximum(ids1, ids2)
+
+# Weights of the edges with the given keys in a network with edge keys
+#  otherKeys, found by a sort-merge join; NaN where the network lacks an
+#  edge
+def joinWeights(keys, otherKeys, otherWeights):
+	result = np.full(len(keys), np.nan)
+	if len(otherKeys) == 0:
+		return result
+	order = np.argsort(otherKeys, kind="mergesort")
+	pos = np.minimum(np.searchsorted(otherKeys, keys, sorter=order), len(order) - 1)
+	found = otherKeys[order[pos]] == keys
+	result[found] = otherWeights[order[pos[found]]]
+	return result
+
+# Union of the edges of several networks (lists of (node1, node2, weights)
+#  as returned by graphEdges) as a list of (node1, node2) tuples, and their
+#  weights as an (edges x networks) matrix, NaN where a network lacks an
+#  edge.  Only the order of the union is worked out with tuples; the
+#  weights are placed by integer edge keys.
+def alignEdges(networks):
+	# Dicts keyed like the original per-graph dicts iterate in the same order
+	dicts = [ dict.fromkeys(zip(node1.tolist(), node2.tolist())) for node1, node2, weights in networks ]
+	union = list(set().union(*[ d.keys() for d in dicts ]))
+	del dicts
+
+	names = np.unique(np.concatenate([ np.unique(np.concatenate([node1, node2])) for node1, node2, weights in networks ]))
+	matrix = np.full((len(union), len(networks)), np.nan)
+	if not union:
+		return union, matrix
+
+	unionKeys = edgeKeys(names, *[ np.array(side, dtype=names.dtype) for side in zip(*union) ])
+	order = np.argsort(unionKeys)
+	for k, (node1, node2, weights) in enumerate(networks):
+		rows = order[np.searchsorted(unionKeys, edgeKeys(names, node1, node2), sorter=order)]
+		matrix[rows, k] = weights
+	return union, matrix
+
+# Z-score of every weight against the weights of its network (the mean and
+#  sample standard deviation of scipy.stats.describe)
+def zNormalize(weights):
+	return (weights - np.mean(weights)) / np.sqrt(np.var(weights, ddof=1))
+
+# Writes one tab-separated line per edge, "node1 node2" followed by the
+#  fields of its matrix row formatted by formatRow, as the original scripts
+#  printed them: lines joined with newlines, then a newline
+def writeEdgeRows(out, edges, matrix, formatRow):
+	if not edges:
+		out.write("\n")
+		return
+
+	lines = ("%s\t%s\t%s\n" % (edge[0], edge[1], formatRow(row)) for edge, row in zip(edges, matrix.tolist()))
+	fastaIO.writeBlocks(out, lines)
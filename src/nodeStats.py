@@ -0,0 +1,133 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Node statistics of weighted protein co-evolution networks, computed from
+# the CSR adjacency of edgelistIO (no networkx)
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created, with eigenvector centrality
+#    + 2026-10-18: Added maximum edge weight and output formatting for batch use
+#    + 2026-10-18: Added ranking of nodes by their sorted edge weights
+#    + 2026-10-18: Networks whose edge weights are all equal raise
+#                   ZeroDivisionError again instead of giving NaN centralities
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
+import edgelistIO
+
+# Networks with at most this many nodes are handled as dense matrices
+DENSE_MAX_NODES = 2000
+
+# Edge weights rescaled to the interval [0,1].  Weights that are all equal
+#  have no range to rescale by; as in the original evc.py, that is a
+#  ZeroDivisionError rather than a NaN for every node.
+def normalizedWeights(adj):
+	minWeight = adj.weight.min()
+	maxWeight = adj.weight.max()
+	if maxWeight == minWeight:
+		raise ZeroDivisionError("Edge weights cannot be normalized to [0,1]: every edge has weight %s" % minWeight)
+	
+	scaleFactor = 1.0 / (maxWeight - minWeight)
+	
+	return (adj.weight - minWeight) * scaleFactor
+
+# Symmetric weight matrix of the network; dense for small networks and
+#  scipy.sparse otherwise
+def weightMatrix(adj, weights):
+	nNodes = len(adj)
+	if nNodes <= DENSE_MAX_NODES:
+		A = np.zeros((nNodes, nNodes))
+		A[adj.rows(), adj.indices] = weights
+		return A
+	
+	return scipy.sparse.csr_matrix((weights, adj.indices, adj.indptr), shape=(nNodes, nNodes))
+
+# Eigenvector centrality of every node after normalizing edge weights to
+#  [0,1], as the leading eigenvector of the weight matrix scaled to unit
+#  length (the same normalization as networkx.eigenvector_centrality).
+#  Dense matrices are solved exactly with LAPACK; sparse ones with ARPACK,
+#  to relative accuracy tol (0 means machine precision).
+def eigenvectorCentrality(adj, tol=0):
+	nNodes = len(adj)
+	A = weightMatrix(adj, normalizedWeights(adj))
+	
+	if scipy.sparse.issparse(A):
+		x = scipy.sparse.linalg.eigsh(A, k=1, which='LA', tol=tol)[1][:, 0]
+	else:
+		x = scipy.linalg.eigh(A, eigvals=(nNodes - 1, nNodes - 1))[1][:, 0]
+	
+	# The weights are non-negative, so the leading eigenvector can be
+	#  taken with non-negative entries
+	if x.sum() < 0:
+		x = -x
+	return x / np.linalg.norm(x)
+
+# Maximum edge weight (MEW) of every node
+def maxEdgeWeights(adj):
+	return np.maximum.reduceat(adj.weight, adj.indptr[:-1])
+
+# Edge weights of every node sorted in descending order (segments of the
+#  result delimited by adj.indptr, like adj.weight)
+def weightProfiles(adj):
+	return adj.weight[np.lexsort((-adj.weight, adj.rows()))]
+
+# Columns [0, k) of the weight profiles of the given nodes as an array;
+#  nodes with fewer than k edges are padded with -inf, which makes a
+#  profile rank below any profile it is a prefix of (as lists compare)
+def profileColumns(adj, profiles, nodes, k):
+	degree = adj.degree()[nodes]
+	columns = np.full((len(nodes), k), -np.inf)
+	present = np.arange(k) < degree[:, np.newaxis]
+	columns[present] = profiles[(adj.indptr[nodes][:, np.newaxis] + np.arange(k))[present]]
+	return columns
+
+# Orders nodes by their weight profiles, in descending lexicographic order;
+#  nodes with identical profiles keep their relative order.  This is the
+#  order of sorting the profiles as Python lists with reverse=True.  Only
+#  the leading k columns are compared, with k doubled for as long as
+#  adjacent nodes tie in all of them and a longer profile could separate
+#  them.
+def rankByWeightProfile(adj, nodes):
+	nodes = np.asarray(nodes)
+	if len(nodes) == 0:
+		return nodes
+	
+	profiles = weightProfiles(adj)
+	degree = adj.degree()[nodes]
+	maxDegree = degree.max()
+	k = 1
+	while True:
+		columns = profileColumns(adj, profiles, nodes, k)
+		rank = np.lexsort([ -columns[:, j] for j in xrange(k-1, -1, -1) ])
+		if k >= maxDegree:
+			return nodes[rank]
+		
+		ranked = columns[rank]
+		tied = (ranked[1:] == ranked[:-1]).all(axis=1)
+		deeper = np.maximum(degree[rank][1:], degree[rank][:-1]) > k
+		if not (tied & deeper).any():
+			return nodes[rank]
+		k = min(2*k, maxDegree)
+
+# Node statistics by the name of the script that computes each one singly
+#  (also the extension of its output files), with the order in which that
+#  script writes the nodes.  Every statistic is calculated as
+#  calculate(adj, **options) and ignores the options it does not take.
+STATISTICS = {
+	"evc": (lambda adj, tol=0, **options: eigenvectorCentrality(adj, tol), lambda adj: adj.graphNodeOrder()),
+	"max": (lambda adj, **options: maxEdgeWeights(adj), lambda adj: edgelistIO.dictOrder(adj.nodes, adj.graphNodeOrder())),
+}
+
+# Tab-separated "node value" lines for the nodes given by order
+def formatNodeValues(adj, values, order):
+	nodes = adj.nodes.tolist()
+	values = values.tolist()
+	return "".join(str(nodes[i]) + "\t" + str(values[i]) + "\n" for i in order.tolist())
@@ -10,26 +10,31 @@
 # maximum weight.  Results are ordered by maximum weight
 #
 # Status: In development
-# Version: 1.0
+# Version: 1.1
 # Language: Python
 # Changelog:
 #    + 2013-01-08: Created
+#    + 2026-10-18: Reads the network with edgelistIO instead of networkx;
+#                   output is unchanged
 
 import sys;
-import networkx as nx;
+import numpy as np;
+import edgelistIO;
 
 def main():
 	# Read the weighted edgelist
-	G = nx.read_weighted_edgelist(sys.stdin)
+	adj = edgelistIO.Adjacency(edgelistIO.readEdgelist(sys.stdin))
 
-	weights = [ (n1, n2, G[n1][n2]['weight']) for n1, n2 in G.edges_iter() ]
+	# Edges in the order (and orientation) networkx used to yield them
+	edges = adj.graphEdgeOrder()
 	
-	# Sort nodes in decending order
-	weights.sort(key=lambda x : x[2], reverse=True)
+	# Sort nodes in decending order (stable, so ties keep that order)
+	edges = edges[np.argsort(-adj.weight[edges], kind='mergesort')]
 	
 	# Write nodes and maxWeights out with UNIX-style line endings
-	for t in weights:
-		sys.stdout.write("%s\t%s\t%f\n" % t )
+	nodes = adj.nodes
+	weights = zip(nodes[adj.rows()[edges]].tolist(), nodes[adj.indices[edges]].tolist(), adj.weight[edges].tolist())
+	sys.stdout.write("".join("%s\t%s\t%f\n" % t for t in weights))
 
 main()
 
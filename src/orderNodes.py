@@ -10,32 +10,34 @@
 # maximum weight.  Results are ordered by maximum weight
 #
 # Status: Complete
-# Version: 1.1
+# Version: 1.2
 # Language: Python
 # Changelog:
 #    + 2013-01-08: Created
 #    + 2013-01-08: Completed development.  Manually spot-checked node result to validate.
+#    + 2026-10-18: Reads the network with edgelistIO instead of networkx;
+#                   output is unchanged
+#    + 2026-10-18: Ranks nodes with the vectorized nodeStats engine; output
+#                   is unchanged
 
 import sys;
-import networkx as nx;
-
-def maxWeight(G, node):
-	#return max( [ G[node][neighbor]['weight'] for neighbor in G.neighbors(node) ] )
-	return sorted([ G[node][neighbor]['weight'] for neighbor in G.neighbors(node) ], reverse=True)
+import edgelistIO;
+import nodeStats;
 
 def main():
 	# Read the weighted edgelist
-	G = nx.read_weighted_edgelist(sys.stdin)
+	adj = edgelistIO.Adjacency(edgelistIO.readEdgelist(sys.stdin))
+	nodes = adj.nodes.tolist()
 
 	# Calculate the maximum weight for each node
-	maxWeights = [ (n, maxWeight(G,n)) for n in G.nodes_iter() ]
+	maxWeights = nodeStats.maxEdgeWeights(adj).tolist()
 	
-	# Sort nodes in decending order
-	maxWeights.sort(key=lambda x : x[1], reverse=True)
+	# Sort nodes in decending order; ties in the maximum weight are broken
+	#  by the next largest weights
+	ranked = nodeStats.rankByWeightProfile(adj, adj.graphNodeOrder())
 	
 	# Write nodes and maxWeights out with UNIX-style line endings
-	for node, weight in maxWeights:
-		sys.stdout.write("%s\t%f\n" % (node, weight[0]))
+	sys.stdout.write("".join("%s\t%f\n" % (nodes[n], maxWeights[n]) for n in ranked.tolist()))
 
 main()
 
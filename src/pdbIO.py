@@ -0,0 +1,156 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Reading of PDB coordinate records into NumPy arrays.  ATOM and HETATM
+# records are parsed from their fixed columns in one vectorized pass into a
+# structured array with the fields
+#    record  : record name ("ATOM  " or "HETATM")
+#    serial  : atom serial number, as text (files of more than 99,999 atoms
+#              carry "*****" or hybrid-36 serials)
+#    name    : atom name, spaces removed (e.g. "CA")
+#    resName : residue name
+#    chain   : chain identifier
+#    resSeq  : residue number and insertion code, stripped (e.g. "52A")
+#    xyz     : coordinates (3 floats)
+#
+# Residue descriptor files (a header line, then tab-separated "residue ax ay
+# az bx by bz" lines giving two points per residue, as read by
+# getPovrayEdgeDesc.py) are read into an array with the fields
+#    residue : residue label
+#    a, b    : the two points (3 floats each)
+#
+# Parsed files are cached as .npz files named after a hash of the file
+# contents, so repeated analyses of the same structure skip the parsing.
+# The cache directory is $PDB_CACHE_DIR, or ~/.cache/coevol-utils/pdb.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+#    + 2026-10-18: Cache entries written atomically; unreadable entries are
+#                   re-parsed
+#    + 2026-10-18: Serials kept as text
+
+import os
+import zipfile
+import tempfile
+import hashlib
+import numpy as np
+
+ATOM_DTYPE = np.dtype([("record", "S6"), ("serial", "S5"), ("name", "S4"), ("resName", "S3"), ("chain", "S1"), ("resSeq", "S5"), ("xyz", np.float64, (3,))])
+
+DEFAULT_CACHE_DIR = os.environ.get("PDB_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "coevol-utils", "pdb"))
+
+# Bumped whenever the cached arrays change, so stale caches are not read
+CACHE_VERSION = 2
+
+LINE_WIDTH = 80
+
+# Parses the ATOM and HETATM records of the text of a PDB file.  Only the
+#  record selection is done per line; every field is cut from a character
+#  matrix of all selected lines at once.
+def parseAtoms(text):
+	lines = [ line.ljust(LINE_WIDTH) for line in text.splitlines() if line[0:6] == "ATOM  " or line[0:6] == "HETATM" ]
+	atoms = np.zeros(len(lines), dtype=ATOM_DTYPE)
+	if not lines:
+		return atoms
+
+	chars = np.frombuffer("".join(line[:LINE_WIDTH] for line in lines), dtype="S1").reshape(-1, LINE_WIDTH)
+	def column(start, end):
+		return chars[:, start:end].copy().view("S%d" % (end - start)).ravel()
+
+	atoms["record"] = column(0, 6)
+	atoms["serial"] = np.char.strip(column(6, 11))
+	atoms["name"] = np.char.replace(column(12, 16), " ", "")
+	atoms["resName"] = column(17, 20)
+	atoms["chain"] = column(21, 22)
+	atoms["resSeq"] = np.char.strip(column(22, 27))
+	for axis, start in enumerate((30, 38, 46)):
+		atoms["xyz"][:, axis] = column(start, start + 8).astype(np.float64)
+	return atoms
+
+# Parses a residue descriptor file.  Lines are split individually, but the
+#  coordinates are converted in one call.
+def parseResidueDescriptors(text):
+	fields = [ line.strip().split('\t') for line in text.splitlines()[1:] ]
+	if any(len(row) != 7 for row in fields):
+		raise ValueError('Wrong number of fields in a residue descriptor string')
+
+	residues = np.zeros(len(fields), dtype=[("residue", "S%d" % max([ len(row[0]) for row in fields ] + [1])), ("a", np.float64, (3,)), ("b", np.float64, (3,))])
+	if fields:
+		table = np.array(fields)
+		residues["residue"] = table[:, 0]
+		xyz = table[:, 1:].astype(np.float64)
+		residues["a"] = xyz[:, 0:3]
+		residues["b"] = xyz[:, 3:6]
+	return residues
+
+def cachePath(cacheDir, kind, data):
+	return os.path.join(cacheDir, "%s-v%d-%s.npz" % (kind, CACHE_VERSION, hashlib.sha1(data).hexdigest()))
+
+# Table of a cache entry, or None if it is missing or cannot be read
+def loadCached(cached):
+	try:
+		with np.load(cached) as entry:
+			return entry["table"]
+	except (IOError, OSError, ValueError, KeyError, EOFError, zipfile.BadZipfile):
+		return None
+
+# Writes a cache entry to a temporary file next to it, then renames it into
+#  place, so concurrent readers never see a partly written entry
+def saveCached(cached, table):
+	cacheDir = os.path.dirname(cached)
+	if not os.path.isdir(cacheDir):
+		try:
+			os.makedirs(cacheDir)
+		except OSError:
+			# Created by a concurrent run
+			if not os.path.isdir(cacheDir):
+				raise
+	fd, temp = tempfile.mkstemp(dir=cacheDir, suffix=".tmp")
+	try:
+		with os.fdopen(fd, "wb") as f:
+			np.savez(f, table=table)
+		os.rename(temp, cached)
+	except:
+		os.remove(temp)
+		raise
+
+# Parses a file with parse(), or loads the result from the cache when the
+#  same contents were parsed before.  cacheDir=None bypasses the cache;
+#  unreadable entries count as missing and failures to write are ignored.
+def readCached(path, kind, parse, cacheDir):
+	data = open(path, "rb").read()
+	if cacheDir is None:
+		return parse(data)
+
+	cached = cachePath(cacheDir, kind, data)
+	if os.path.exists(cached):
+		table = loadCached(cached)
+		if table is not None:
+			return table
+
+	table = parse(data)
+	try:
+		saveCached(cached, table)
+	except (IOError, OSError):
+		pass
+	return table
+
+# Reads the ATOM and HETATM records of a PDB file
+def readAtoms(path, cacheDir=DEFAULT_CACHE_DIR):
+	return readCached(path, "atoms", parseAtoms, cacheDir)
+
+def readResidueDescriptors(path, cacheDir=DEFAULT_CACHE_DIR):
+	return readCached(path, "residues", parseResidueDescriptors, cacheDir)
+
+# Atoms of the given record type(s) (e.g. "ATOM  ") and, optionally, chains
+def selectAtoms(atoms, records, chains=None):
+	mask = np.in1d(atoms["record"], records)
+	if chains is not None:
+		mask &= np.in1d(atoms["chain"], list(chains))
+	return atoms[mask]
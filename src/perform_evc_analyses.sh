@@ -36,17 +36,11 @@
 
 echo === Calculating scores ===
 
-# Calculate network summary statistics
-for series in evc max; do
-	mkdir $series
-	mkdir $series/std
-	mkdir $series/sub
-
-	echo = $series =
-	# If there are already calculated, comment out the next two lines
-	for i in nets/std/*; do echo $i; ./scripts/$series.py $i > $series/std/`basename $i`.$series; done
-	for i in nets/sub/*; do echo $i; ./scripts/$series.py $i > $series/sub/`basename $i`.$series; done
-done;
+# Calculate network summary statistics (writes evc/std/, evc/sub/, max/std/
+# and max/sub/); each network is read once for both statistics.  Increase
+# --workers to spread the networks over several processes.
+# If there are already calculated, comment out the next line
+./scripts/batchNodeStats.py --stats evc max --workers 1 nets/std nets/sub
 
 # compiling master EVC tables
 echo === Compiling tables ===
@@ -0,0 +1,224 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Renders the Jaccard analysis plots of many files in one run.  Every file,
+# with a name of the form
+#    SubFam1_Alg1_SubFam2_Alg2.nja   (nodal analysis)
+#    SubFam1_Alg1_SubFam2_Alg2.eja   (edgewise analysis)
+# is drawn as plotJaccardNodes.py / plotJaccardEdges.py draw it: the
+# observed Jaccard index, the null expectation with its 95% region and the
+# upper limit of the index as a function of the number of items included.
+#
+# matplotlib is imported once per worker process with the Agg backend, and
+# each worker reuses one figure, clearing only its curves between plots.
+# Curves with many more points than the image has pixel columns are
+# decimated to the first, last, lowest and highest point of every pixel
+# column, which leaves the rendered image visually unchanged (only the
+# antialiasing of line edges differs) and lets matplotlib draw curves with
+# millions of points that overflow the Agg renderer otherwise.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created from plotJaccardNodes.py and plotJaccardEdges.py
+#    + 2026-10-18: Images named after the whole input name (X.nja.png), and
+#                   runs drawing two inputs to one image rejected
+
+import os
+import sys
+import glob
+import argparse
+import multiprocessing
+import numpy as np
+
+DPI = 600
+
+# Axis label and title of each kind of analysis, by file extension
+KINDS = {
+	".nja": ("Number of nodes included", "Nodal Jaccard Analysis"),
+	".eja": ("Number of edges included", "Edgewise Jaccard Analysis"),
+}
+
+# Declare correct capitalization of names
+nameDict = { "elsc" : "ELSC", "omes" : "OMES", "mcbasc" : "McBASC", "sca" : "SCA", "znmi" : "ZNMI", "ccpa": "CcpA", "galrs": "GalRS", "gntr" : "GntR", "purr": "PurR", "rbsra": "RbsR-A", "trer" : "TreR", "galr" : "GalR", "gals" : "GalS" }
+def capname(name):
+	if name in nameDict:
+		return nameDict[name]
+
+	return name
+
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
+
+# Columns of a Jaccard analysis file (threshold, observed J, null mean, null
+#  variance, z, maximum J)
+def readJaccardTable(path):
+	with open(path) as f:
+		text = f.read()
+	columns = len(text[:text.find("\n")].split())
+	values = np.fromstring(text, sep=" ")
+	if columns < 6 or len(values) % columns != 0:
+		errorOut("Expected six columns on every line of %s\n" % path, 1)
+	return values.reshape(-1, columns)
+
+# Indices of the points kept when drawing curves over x (increasing) at
+#  the given number of pixel columns: the first and last point of every
+#  column and the lowest and highest point of every curve in it
+def decimate(x, curves, pixels):
+	if len(x) <= 4*pixels:
+		return np.arange(len(x))
+
+	span = x[-1] - x[0]
+	column = np.minimum(((x - x[0]) / span * pixels).astype(np.int64) if span > 0 else np.zeros(len(x), dtype=np.int64), pixels - 1)
+	starts = np.flatnonzero(np.concatenate([[True], column[1:] != column[:-1]]))
+	ends = np.concatenate([starts[1:], [len(x)]])
+
+	# Curve points sorted by pixel column, then value: the lowest and
+	#  highest point of every column come first and last in its group
+	keep = [ starts, ends - 1 ]
+	for y in curves:
+		order = np.lexsort((y, column))
+		keep.append(order[starts])
+		keep.append(order[ends - 1])
+	return np.unique(np.concatenate(keep))
+
+# Figure reused by every plot of a worker
+_figure = None
+
+def figureTemplate():
+	global _figure
+	if _figure is None:
+		import matplotlib
+		matplotlib.use("Agg")
+		import matplotlib.pyplot as plt
+		_figure = plt.figure()
+		ax = _figure.add_subplot(111)
+		ax.set_ylabel("Jaccard index")
+	return _figure
+
+# Draws the analysis in path to outpath.  The kind of analysis (".nja" or
+#  ".eja") is taken from the file extension unless given.
+def renderPlot(path, outpath, dpi=DPI, kind=None):
+	if kind is None:
+		kind = os.path.splitext(path)[1]
+	xlabel, title = KINDS[kind]
+
+	# Parse the file name
+	nameFields = map(capname, os.path.basename(path).replace(kind, "").split("_"))
+
+	table = readJaccardTable(path)
+	thresh, Jexpr, Jtheo, Jmax = table[:, 0], table[:, 1], table[:, 2], table[:, 5]
+
+	# Error assumes that the third field is variance (not stdev)
+	JtheoErr = 1.96*np.sqrt(table[:, 3])
+	JtheoErrMin = Jtheo - JtheoErr
+	JtheoErrMax = Jtheo + JtheoErr
+
+	fig = figureTemplate()
+	keep = decimate(thresh, [Jexpr, Jtheo, Jmax, JtheoErrMin, JtheoErrMax], int(fig.get_figwidth()*dpi))
+	thresh, Jexpr, Jtheo, Jmax, JtheoErrMin, JtheoErrMax = [ v[keep] for v in (thresh, Jexpr, Jtheo, Jmax, JtheoErrMin, JtheoErrMax) ]
+
+	# Extend the error region back to zero-items included to eliminate ugly
+	# closure of the error region at items = 0 on the plot
+	threshZero = np.concatenate([[0], thresh])
+	JtheoErrMinZero = np.concatenate([JtheoErrMin[:1], JtheoErrMin])
+	JtheoErrMaxZero = np.concatenate([JtheoErrMax[:1], JtheoErrMax])
+
+	ax = fig.axes[0]
+	ax.cla()
+	ax.set_ylim((-0.2,1.1))
+
+	ax.plot(thresh, Jmax, 'k--')
+	ax.fill_between(threshZero, JtheoErrMinZero, JtheoErrMaxZero, facecolor="#ffb5b5", edgecolor="#ff4c4c", antialiased=True)
+	ax.plot(thresh, Jtheo, 'k-')
+	ax.plot(thresh, Jexpr, 'b-')
+
+	ax.set_xlabel(xlabel)
+	ax.set_ylabel("Jaccard index")
+	ax.set_title("%s: %s %s vs %s %s" % ((title,) + tuple(nameFields)))
+	fig.savefig(outpath, dpi=dpi)
+
+def renderTask(task):
+	path, outpath, dpi = task
+	renderPlot(path, outpath, dpi)
+	return outpath
+
+# Expands the command line inputs (directories, glob patterns or single
+#  files) to a sorted list of distinct .nja/.eja files
+def jaccardPaths(inputs):
+	paths = []
+	for item in inputs:
+		if os.path.isdir(item):
+			paths.extend(os.path.join(item, name) for name in sorted(os.listdir(item)) if os.path.splitext(name)[1] in KINDS)
+		elif os.path.isfile(item):
+			paths.append(item)
+		else:
+			matches = sorted(glob.glob(item))
+			if not matches:
+				errorOut("No Jaccard analyses found for %s\n" % item, 1)
+			paths.extend(matches)
+	for path in paths:
+		if os.path.splitext(path)[1] not in KINDS:
+			errorOut("%s is not a .nja or .eja file\n" % path, 1)
+
+	# A file matched by several inputs is drawn once
+	seen = set()
+	unique = []
+	for path in paths:
+		if os.path.abspath(path) not in seen:
+			seen.add(os.path.abspath(path))
+			unique.append(path)
+	return unique
+
+# Image of an analysis: its file name plus the image format (X.nja.png and
+#  X.eja.png for the two analyses of a comparison), in outDir or next to it
+def outputPath(path, outDir, format):
+	if outDir is None:
+		outDir = os.path.dirname(path)
+	return os.path.join(outDir, os.path.basename(path) + "." + format)
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Plots of many nodal (.nja) and edgewise (.eja) Jaccard analyses")
+	parser.add_argument("inputs", nargs="+", help="Directories, glob patterns or .nja/.eja files")
+	parser.add_argument("--out-dir", default=None, help="Directory of the images, named INPUT.FORMAT (default: next to each input)")
+	parser.add_argument("--format", default="png", help="Image format, as a file extension (default: png)")
+	parser.add_argument("--dpi", type=int, default=DPI, help="Resolution (default: %d)" % DPI)
+	parser.add_argument("--workers", type=int, default=1, help="Number of rendering processes (default: 1)")
+	return parser.parse_args()
+
+#Main body
+def main():
+	args = parseArgs()
+	paths = jaccardPaths(args.inputs)
+	if args.out_dir is not None and not os.path.isdir(args.out_dir):
+		os.makedirs(args.out_dir)
+
+	tasks = [ (path, outputPath(path, args.out_dir, args.format), args.dpi) for path in paths ]
+	seen = {}
+	for path, outpath, dpi in tasks:
+		if os.path.abspath(outpath) in seen:
+			errorOut("%s and %s would both be drawn to %s\n" % (seen[os.path.abspath(outpath)], path, outpath), 1)
+		seen[os.path.abspath(outpath)] = path
+
+	if args.workers > 1:
+		pool = multiprocessing.Pool(args.workers)
+		done = pool.imap_unordered(renderTask, tasks)
+	else:
+		pool = None
+		done = (renderTask(task) for task in tasks)
+
+	for outpath in done:
+		sys.stdout.write(outpath + "\n")
+		sys.stdout.flush()
+
+	if pool is not None:
+		pool.close()
+		pool.join()
+
+if __name__ == '__main__':
+	main()
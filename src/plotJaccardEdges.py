@@ -13,81 +13,31 @@
 # This variant is for jaccard edgewise analysis (not nodal)
 #
 # Status: Complete
-# Version: 1.0
+# Version: 1.1
 # Language: Python
 # Changelog:
 #    + 2013-01-14: Forked from plotJaccardNodesErrorRegion.py to reflect changes
 #                   in graphing schema
 #    + 2013-01-17: Added GalR and GalS to the capitalization list
+#    + 2026-10-18: Now draws through plotJaccard.renderPlot (Agg backend, long
+#                   curves decimated to the image resolution)
 
 import sys
-import itertools
-import math
-import matplotlib.pyplot as plt
-import os.path
-
-
+import plotJaccard
 
 def usage():
 	sys.stderr.write("Usage: plotJaccardNode [Jaccard Analysis NJE file] [Output file name]")
-	
+
 def errorOut(message, code):
 	sys.stderr.write("Error: %s" % message)
 	exit(code)
 
-# Declare correct capitalization of names
-nameDict = { "elsc" : "ELSC", "omes" : "OMES", "mcbasc" : "McBASC", "sca" : "SCA", "znmi" : "ZNMI", "ccpa": "CcpA", "galrs": "GalRS", "gntr" : "GntR", "purr": "PurR", "rbsra": "RbsR-A", "trer" : "TreR", "galr" : "GalR", "gals" : "GalS" }
-def capname(name):
-	if name in nameDict:
-		return nameDict[name]
-	
-	return name
-	
 def main():
 	if len(sys.argv) != 3:
 		usage()
-		errorOut("Expected 2 arguments")
+		errorOut("Expected 2 arguments\n", 1)
 
-	# Read the file path
-	path = sys.argv[1]
-	outpath = sys.argv[2]
+	plotJaccard.renderPlot(sys.argv[1], sys.argv[2], kind=".eja")
 
-	# Parse the file name
-	nameFields = map(capname,os.path.basename(path).replace(".eja","").split("_"))
-	
-	# Parse the data in the file
-	lines = [ line.strip().split(" ") for line in open(path) ]
-	
-	# Extract threshold
-	thresh = [ float(line[0]) for line in lines ]
-	Jexpr = [ float(line[1]) for line in lines ]
-	Jtheo = [ float(line[2]) for line in lines ]
-	Jmax  = [ float(line[5]) for line in lines ]
-	
-	# Error assumes that the third field is variance (not stdev, as I originally
-	#  had intended)
-	JtheoErr = [ 1.96*math.sqrt(float(line[3])) for line in lines ]
-	JtheoErrMin = [ v - e for v,e in itertools.izip(Jtheo, JtheoErr) ]
-	JtheoErrMax = [ v + e for v,e in itertools.izip(Jtheo, JtheoErr) ]
-	
-	# Extend the error region back to zero-items included to eliminate ugly 
-	# closure of the error region at items = 0 on the plot
-	threshZero = list(itertools.chain([0], thresh))
-	JtheoErrMinZero = list(itertools.chain([JtheoErrMin[0]], JtheoErrMin))
-	JtheoErrMaxZero = list(itertools.chain([JtheoErrMax[0]], JtheoErrMax))
-	
-	plt.figure()
-	
-	plt.ylim((-0.2,1.1))
-	
-	plt.plot(thresh, Jmax, 'k--')
-	plt.fill_between(threshZero, JtheoErrMinZero, JtheoErrMaxZero, facecolor="#ffb5b5", edgecolor="#ff4c4c", antialiased=True)
-	plt.plot(thresh, Jtheo, 'k-')
-	plt.plot(thresh, Jexpr, 'b-')
-	
-	plt.xlabel("Number of edges included")
-	plt.ylabel("Jaccard index")
-	plt.title("Edgewise Jaccard Analysis: %s %s vs %s %s" % tuple(nameFields))
-	plt.savefig(outpath, dpi=600)
-	
-main()
\ No newline at end of file
+if __name__ == '__main__':
+	main()
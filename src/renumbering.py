@@ -0,0 +1,154 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Applies residue renumberings (translation tables of tab-separated
+# "from to" lines, e.g. alignment column to lac numbering) to tab-separated
+# score streams, replacing ApplyRenumbering.exe.  A table, or a chain of
+# tables applied one after another, is loaded into sorted source IDs and an
+# integer lookup array, and the residue columns of a stream are rewritten
+# together, a block of lines at a time.  As in ApplyRenumbering, a line
+# whose residue is missing from the table is dropped, empty lines are
+# skipped and every line must have the same number of fields.  CRLF input
+# is accepted; output uses LF.
+#
+# Usage: renumbering.py [tables...] < scores > renumbered
+#   e.g. tail -n +2 raw.znmi | ./renumbering.py col_to_lac_map.tsv > raw.znmi.map
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created to replace ApplyRenumbering.exe
+
+import sys
+import argparse
+import itertools
+import numpy as np
+import fastaIO
+
+# Lines renumbered at a time
+BLOCK_LINES = 65536
+
+def errorOut(message, code):
+	sys.stderr.write("Error: %s\n" % message)
+	sys.stderr.write("Terminating abnormally\n")
+	exit(code)
+
+# Residue translation.  sources are the sorted residue IDs that can be
+#  translated and targets[lookup[i]] is the translation of sources[i]
+#  (lookup is -1 where a chain of tables drops the residue).
+class Renumbering:
+	def __init__(self, sources, targets, lookup):
+		self.sources = sources
+		self.targets = targets
+		self.lookup = lookup
+
+	# Index into targets of every ID of an array; -1 if it is not translated
+	def indices(self, ids):
+		if len(self.sources) == 0:
+			return np.full(len(ids), -1, dtype=np.int64)
+		pos = np.minimum(np.searchsorted(self.sources, ids), len(self.sources) - 1)
+		return np.where(self.sources[pos] == ids, self.lookup[pos], -1)
+
+	# Translation of an array of IDs and whether each was translated
+	def translate(self, ids):
+		index = self.indices(ids)
+		mapped = index >= 0
+		result = np.array(ids, dtype=object)
+		result[mapped] = self.targets[index[mapped]]
+		return result, mapped
+
+	# This renumbering followed by another
+	def then(self, other):
+		index = self.lookup.copy()
+		index[index >= 0] = other.indices(self.targets[index[index >= 0]])
+		return Renumbering(self.sources, other.targets, index)
+
+	# "from to" pairs of every translated residue, sorted by source
+	def pairs(self):
+		translated = self.lookup >= 0
+		return zip(self.sources[translated].tolist(), self.targets[self.lookup[translated]].tolist())
+
+# Reads a translation table; a residue listed twice keeps its last
+#  translation
+def readTable(path):
+	with open(path) as f:
+		return parseTable(f.read(), path)
+
+def parseTable(text, path):
+	lines = [ line for line in text.splitlines() if line.strip() ]
+	fields = [ line.split('\t') for line in lines ]
+	for n, row in enumerate(fields):
+		if len(row) != 2:
+			errorOut("Invalid dictionary file %s; expected two fields on line %d but found %d" % (path, n+1, len(row)), 254)
+
+	sources = np.array([ row[0] for row in fields ], dtype=str)
+	targets = np.array([ row[1] for row in fields ], dtype=str)
+	last = len(sources) - 1 - np.unique(sources[::-1], return_index=True)[1]
+	return Renumbering(sources[last], targets, last)
+
+# One renumbering applying the tables in order
+def readChain(paths):
+	result = readTable(paths[0])
+	for path in paths[1:]:
+		result = result.then(readTable(path))
+	return result
+
+# Renumbered lines of a block: the given columns (1-based) translated,
+#  lines with an untranslated residue dropped
+def renumberBlock(lines, renumbering, columns):
+	fields = zip(*[ line.split('\t') for line in lines ])
+	keep = np.ones(len(lines), dtype=bool)
+	for column in set(columns):
+		translated, mapped = renumbering.translate(np.array(fields[column-1], dtype=str))
+		fields[column-1] = translated.tolist()
+		keep &= mapped
+	return [ "\t".join(row) + "\n" for row, kept in itertools.izip(itertools.izip(*fields), keep.tolist()) if kept ]
+
+# Renumbers a tab-separated stream block by block
+def renumberStream(stream, renumbering, columns):
+	fieldCount = None
+	lineNumber = 0
+	while True:
+		block = list(itertools.islice(stream, BLOCK_LINES))
+		if not block:
+			break
+
+		lines = []
+		for line in block:
+			lineNumber += 1
+			line = line.rstrip("\r\n")
+			if not line.strip():
+				continue
+			count = line.count('\t') + 1
+			if fieldCount is None:
+				fieldCount = count
+			if count != fieldCount:
+				errorOut("Invalid input file: Line %d contained %d fields, but all previous lines contained %d" % (lineNumber, count, fieldCount), 253)
+			if count < max(columns):
+				errorOut("Invalid input file: Command was to alter column %d, but line %d contains only %d fields" % (max(columns), lineNumber, count), 252)
+			lines.append(line)
+
+		if lines:
+			yield "".join(renumberBlock(lines, renumbering, columns))
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Renumbers the residue columns of a tab-separated score stream (stdin to stdout)")
+	parser.add_argument("tables", nargs="+", help="Translation tables (\"from to\" lines); several are applied in order")
+	parser.add_argument("--columns", type=int, nargs="+", default=[1, 2], help="1-based columns holding residues (default: 1 2)")
+	args = parser.parse_args()
+	if min(args.columns) < 1:
+		parser.error("columns are numbered from 1")
+	return args
+
+#Main body
+def main():
+	args = parseArgs()
+	renumbering = readChain(args.tables)
+	fastaIO.writeBlocks(sys.stdout, renumberStream(sys.stdin, renumbering, args.columns))
+
+if __name__ == '__main__':
+	main()
@@ -6,58 +6,90 @@
 # University of Kansas Medical Center
 # 2012-10-10
 
-# Aligns a set of weighted edgelists, reporting their weights
+# Subtracts weighted edgelists: for every edge of the first network that
+#   the other network also has (in either orientation), writes
+#   node1 node2 weight1-weight2
+#   with the edge oriented and ordered as in the first network.
+#
+# With more than two networks, --contrasts I-J ... (1-based network
+#   numbers; e.g. the std - sub noise subtraction and the differentials of
+#   several subfamilies) writes one column per contrast for every edge of
+#   the first network, left empty where either operand lacks the edge;
+#   edges without any difference are skipped.  --normalize scales every
+#   network first, to [0,1] (unity) or to z-scores (z).
+#
+# Changelog:
+#    + 2026-10-18: Matches edges by orientation-free integer keys with a
+#                   vectorized sort-merge join (edges stored in the opposite
+#                   orientation were dropped); added --contrasts and
+#                   --normalize
 
 import sys
+import argparse
 import numpy as np
-import scipy as sp
-import scipy.linalg
-from scipy import stats
-import networkx as nx	
-
-def threshold_edges(G, thresh):
-	edges_below_threshold=[e for e in G.edges_iter() if G[e[0]][e[1]]['weight'] < thresh]
-	for e1, e2 in edges_below_threshold:
-		G.remove_edge(e1,e2)
-		
-def strip_isolates(G):
-	isolated_nodes=[n for n in G.nodes_iter() if G.degree(n) == 0]
-	#Remove isolates
-	for n in isolated_nodes:
-		G.remove_node(n)
-		
+import edgelistIO
+import fastaIO
+import networkAlignment
+
 #Normalizes weights to the interval [0,1]		
-def unityWeightNormalize(G):
-	sortedWeights = [ G[e1][e2]['weight'] for e1, e2 in G.edges_iter() ]
-	sortedWeights.sort()
-	
-	minWeight=sortedWeights[0]
-	maxWeight=sortedWeights[len(sortedWeights)-1]
+def unityWeightNormalize(weights):
+	minWeight = weights.min()
+	maxWeight = weights.max()
 	
 	scaleFactor = 1.0 / (maxWeight - minWeight)
-	
-	for e1, e2 in G.edges_iter():
-		G[e1][e2]['weight'] = (G[e1][e2]['weight'] - minWeight)*scaleFactor
+	return (weights - minWeight)*scaleFactor
+
+NORMALIZATIONS = { "unity": unityWeightNormalize, "z": networkAlignment.zNormalize }
+
+# Edges of a network as (node1, node2, weight) arrays, oriented and ordered
+#  as networkx yields them (G.edges_iter())
+def orientedEdges(adj):
+	positions = adj.graphEdgeOrder()
+	return adj.nodes[adj.rows()[positions]], adj.nodes[adj.indices[positions]], adj.weight[positions]
+
+# Parses "I-J" into 0-based network indices
+def parseContrast(text, nNetworks):
+	try:
+		i, j = [ int(x) - 1 for x in text.split('-') ]
+	except ValueError:
+		sys.exit("Contrasts are written as I-J (e.g. 1-2), not %s" % text)
+	if not (0 <= i < nNetworks and 0 <= j < nNetworks):
+		sys.exit("Contrast %s refers to a network that was not given" % text)
+	return i, j
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Differences between the edge weights of weighted edgelists")
+	parser.add_argument("networks", nargs="+", help="Weighted edgelists; edges are reported as in the first")
+	parser.add_argument("--contrasts", nargs="+", default=None, help="Differences to write, as I-J with 1-based network numbers (default: 1-2)")
+	parser.add_argument("--normalize", choices=["none"] + sorted(NORMALIZATIONS), default="none", help="Scale the weights of every network before subtracting (default: none)")
+	args = parser.parse_args()
+	if len(args.networks) < 2:
+		parser.error("at least two networks are needed")
+	if args.contrasts is None:
+		if len(args.networks) != 2:
+			parser.error("--contrasts is needed for more than two networks")
+		args.contrasts = ["1-2"]
+	return args
 		
 def main():
-	if len(sys.argv) != 3: 
-		sys.exit("Usage: [Weighted edgelist1] [Weighted edgelist2]")
+	args = parseArgs()
+	contrasts = [ parseContrast(text, len(args.networks)) for text in args.contrasts ]
 
 	#Read the graphs
-	graphs = [ nx.read_weighted_edgelist(path) for path in sys.argv[1:] ]
-	graphDicts = [ { (e1, e2) : G[e1][e2]['weight'] for e1, e2 in G.edges_iter()} for G in graphs]
-	#allEdgePairs = set().union(*[G.keys() for G in graphDicts])
-	
-	#Write a header
-	#print "\t".join(['node1', 'node2'] + sys.argv[1:] + ['\n'])
-	
-	#For every edge pair, construct and write a line like: node1 (tab) node2 (tab) weight1 (tab) weight2...
-	#print "\n".join(["\t".join(map(str,[edge[0], edge[1], graphDicts[0][edge] - graphDicts[1][edge]])) for edge in graphDicts[0].keys()])
-	for edge in graphs[0].edges_iter():
-		if edge in graphDicts[1]:
-			print "\t".join(map(str,[edge[0], edge[1], graphDicts[0][edge] - graphDicts[1][edge]]))
-		
-	
-	
+	edges = [ orientedEdges(edgelistIO.Adjacency(edgelistIO.readEdgelist(path))) for path in args.networks ]
+	if args.normalize != "none":
+		edges = [ (node1, node2, NORMALIZATIONS[args.normalize](weights)) for node1, node2, weights in edges ]
+
+	# Weights of every network on the edges of the first
+	names = np.unique(np.concatenate([ np.concatenate([node1, node2]) for node1, node2, weights in edges ]))
+	keys = [ networkAlignment.canonicalEdgeKeys(names, node1, node2) for node1, node2, weights in edges ]
+	weights = [ edges[0][2] ] + [ networkAlignment.joinWeights(keys[0], keys[k], edges[k][2]) for k in xrange(1, len(edges)) ]
+
+	differences = np.column_stack([ weights[i] - weights[j] for i, j in contrasts ])
+	kept = ~np.isnan(differences).all(axis=1)
+
+	#For every edge, write a line like: node1 (tab) node2 (tab) difference1 (tab) difference2...
+	node1, node2 = edges[0][0][kept].tolist(), edges[0][1][kept].tolist()
+	fastaIO.writeBlocks(sys.stdout, ("%s\t%s\t%s\n" % (u, v, "\t".join([ '' if d != d else str(d) for d in row ])) for u, v, row in zip(node1, node2, differences[kept].tolist())))
 
-main()
\ No newline at end of file
+main()
@@ -0,0 +1,22 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Converts a text weighted edgelist (.wel) into the binary edgelist
+# container (.bwel) read by edgelistIO, so that the network is parsed once
+# and memory-mapped by every later analysis.
+
+import sys
+import edgelistIO
+
+def main():
+	if len(sys.argv) != 3:
+		sys.exit("Usage: [Weighted edgelist] [Output binary edgelist]")
+
+	el = edgelistIO.readEdgelist(sys.argv[1])
+	edgelistIO.writeBinary(el, sys.argv[2])
+
+if __name__ == '__main__':
+	main()
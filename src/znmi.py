@@ -0,0 +1,237 @@
+#!/cygdrive/c/Python27/python.exe
+#
+# Swint-Kruse Laboratory
+# University of Kansas Medical Center
+# 2026-10-18
+#
+# Mutual information scoring of a multiple sequence alignment in NumPy:
+# per-column entropy, all-pairs joint entropy, MI, NMI and the Z-normalized
+# NMI (ZNMI) of Brown & Brown (PLoS ONE 2010), as computed by ZNMIAlg.cs
+# (ZNMI.exe).  As there, gaps are ignored: column entropies count only
+# non-gap residues and joint entropies only rows without a gap in either
+# column.
+#
+# Joint residue counts come from products of one-hot encoded column
+# blocks.  Only two blocks are encoded at once, so the memory of the
+# encodings is bounded by the column block size (--block-size) rather than
+# by the alignment width; the pair tables themselves are cols x cols.
+#
+# Output is one line per scored column pair, as ZNMIAlg.getXYZFormat
+# writes them:
+#    r c nmi znmi e_r e_c je gap_r gap_c
+# or, with --scores, the "i j score" table (with header) that ZNMI.exe
+# writes.  Columns are numbered from 0.
+#
+# Status: Complete
+# Version: 1.0
+# Language: Python
+# Changelog:
+#    + 2026-10-18: Created
+
+import sys
+import argparse
+import numpy as np
+import fastaIO
+
+GAP = ord('-')
+
+# Entropy and gap cutoffs of ZNMI.exe
+MIN_ENTROPY = 0.198515243
+MAX_GAPS = 0.1
+ZERO_THRESHOLD = .0000000001
+
+def errorOut(message, code):
+	sys.stderr.write("Error: %s" % message)
+	exit(code)
+
+# Alignment as a (rows x cols) array of character codes
+def encodeAlignment(seqs):
+	if not seqs:
+		errorOut("The alignment is empty\n", 1)
+	cols = len(seqs[0])
+	if any(len(seq) != cols for seq in seqs):
+		errorOut("Sequences in the alignment differ in length\n", 1)
+	return np.frombuffer("".join(seqs), dtype=np.uint8).reshape(len(seqs), cols)
+
+# Residues as indices 0..K-1 of the non-gap symbols present, with gaps as -1
+def residueCodes(aln):
+	symbols = np.flatnonzero(np.bincount(aln.ravel(), minlength=256))
+	symbols = symbols[symbols != GAP]
+	lookup = np.full(256, -1, dtype=np.int64)
+	lookup[symbols] = np.arange(len(symbols))
+	return lookup[aln], len(symbols)
+
+# Entropy (natural log) of every row of counts (summed over the last axis),
+#  as -sum(p log p) with p = n * (1/T) like ZNMIAlg, where T is the total
+#  count; 0 if T is 0
+def countEntropy(counts):
+	total = counts.sum(axis=-1)[..., np.newaxis]
+	with np.errstate(divide="ignore"):
+		p = counts * (1.0 / total)
+	terms = np.zeros(counts.shape)
+	present = counts > 0
+	terms[present] = p[present] * np.log(p[present])
+
+	# Summed sequentially (np.sum may change its order with the array
+	#  shape, and so with the block size)
+	return -terms.cumsum(axis=-1)[..., -1]
+
+def gapFractions(aln):
+	return (aln == GAP).sum(axis=0) / float(aln.shape[0])
+
+def entropy(codes, nSymbols):
+	counts = np.zeros((codes.shape[1], nSymbols))
+	for symbol in xrange(nSymbols):
+		counts[:, symbol] = (codes == symbol).sum(axis=0)
+	return countEntropy(counts)
+
+# One-hot encoding of a block of columns as a (rows x cols*K) matrix; gaps
+#  are all-zero
+def oneHot(codes, nSymbols, dtype):
+	rows, cols = codes.shape
+	result = np.zeros((rows, cols*nSymbols), dtype=dtype)
+	r, c = np.nonzero(codes >= 0)
+	result[r, c*nSymbols + codes[r, c]] = 1
+	return result
+
+# Joint entropy of every pair of columns.  The joint counts of two column
+#  blocks are the product of their one-hot matrices; rows with a gap in
+#  either column have no joint residue and are not counted.
+def jointEntropy(codes, nSymbols, blockSize=64):
+	rows, cols = codes.shape
+
+	# Counts are exact in float32 as long as they fit its mantissa
+	dtype = np.float32 if rows < 2**24 else np.float64
+
+	# Only two blocks are encoded at a time: block i for the outer loop and
+	#  block j, re-encoded for every i, for the inner one
+	starts = range(0, cols, blockSize)
+	result = np.zeros((cols, cols))
+	for i, start1 in enumerate(starts):
+		n1 = min(blockSize, cols - start1)
+		block1 = oneHot(codes[:, start1:start1+n1], nSymbols, dtype)
+		for j in xrange(i, len(starts)):
+			start2 = starts[j]
+			n2 = min(blockSize, cols - start2)
+			block2 = block1 if j == i else oneHot(codes[:, start2:start2+n2], nSymbols, dtype)
+			# Residue pair counts of every column pair as rows, so that each
+			#  entropy is summed the same way whatever the block size
+			counts = np.dot(block1.T, block2).reshape(n1, nSymbols, n2, nSymbols)
+			counts = counts.transpose(0, 2, 1, 3).reshape(n1, n2, nSymbols*nSymbols).astype(np.float64)
+			je = countEntropy(counts)
+			if i == j:
+				# (r, c) and (c, r) sum the same counts in a different order;
+				#  keep r < c as in off-diagonal blocks
+				je = np.triu(je) + np.triu(je, 1).T
+			result[start1:start1+n1, start2:start2+n2] = je
+			result[start2:start2+n2, start1:start1+n1] = je.T
+	return result
+
+# Mutual information of every pair of columns; NaN off the diagonal where
+#  negative (possible when gaps are ignored) and suppressNegative is set
+def mi(e, je, suppressNegative=True):
+	result = e[:, np.newaxis] + e[np.newaxis, :] - je
+	if suppressNegative:
+		with np.errstate(invalid="ignore"):
+			result[result < 0] = np.nan
+	return result
+
+# MI normalized by the joint entropy; NaN where the joint entropy is zero
+#  or, with suppressNegative, where the NMI is negative
+def nmi(e, je, suppressNegative=True):
+	result = np.full(je.shape, np.nan)
+	scored = je > ZERO_THRESHOLD
+	result[scored] = (e[:, np.newaxis] + e[np.newaxis, :] - je)[scored] / je[scored]
+	if suppressNegative:
+		with np.errstate(invalid="ignore"):
+			result[result < 0] = np.nan
+	return result
+
+# Z-normalized NMI.  Columns with entropy below minEntropy or a gap fraction
+#  of maxGap or more are excluded; every remaining NMI is compared with the
+#  combined NMI distributions (mean, population variance) of its two
+#  columns.  NaN marks pairs without a score.
+def znmi(e, je, gapPct, minEntropy=MIN_ENTROPY, maxGap=MAX_GAPS, suppressNegative=True):
+	nmiValues = nmi(e, je, suppressNegative)
+
+	result = nmiValues.copy()
+	excluded = (e < minEntropy) | (gapPct >= maxGap)
+	result[excluded, :] = np.nan
+	result[:, excluded] = np.nan
+	np.fill_diagonal(result, np.nan)
+
+	# Column distributions, without the diagonal and missing values
+	valid = ~np.isnan(result)
+	count = valid.sum(axis=0).astype(np.float64)
+	values = np.where(valid, result, 0)
+	with np.errstate(divide="ignore", invalid="ignore"):
+		mean = values.sum(axis=0) / count
+		vari = (np.where(valid, result - mean[np.newaxis, :], 0)**2).sum(axis=0) / count
+
+		v1 = vari[:, np.newaxis]
+		v2 = vari[np.newaxis, :]
+		zmean = (mean[:, np.newaxis]*v2 + mean[np.newaxis, :]*v1) / (v1 + v2)
+		zstde = np.sqrt((v1*v2) / (v1 + v2))
+
+		# Conserved columns give a zero (or undefined) spread; they are not scored
+		scored = valid & (zstde > ZERO_THRESHOLD)
+		result = np.where(scored, (result - zmean) / zstde, np.nan)
+	return result, nmiValues
+
+# Formats a number as .NET's default Double.ToString() does (15 significant
+#  digits), so that output matches ZNMI.exe
+def dotNetDouble(x):
+	return "%.15G" % (x + 0.0)
+
+# Writes the scored pairs (r < c) as ZNMIAlg.getXYZFormat does
+def writeXYZ(out, znmiValues, nmiValues, e, je, gapPct):
+	rows, cols = np.nonzero(np.triu(~np.isnan(znmiValues), 1))
+	fields = zip(rows.tolist(), cols.tolist(), nmiValues[rows, cols].tolist(), znmiValues[rows, cols].tolist(), e[rows].tolist(), e[cols].tolist(), je[rows, cols].tolist(), gapPct[rows].tolist(), gapPct[cols].tolist())
+	fastaIO.writeBlocks(out, ("%d\t%d\t%s\n" % (f[0], f[1], "\t".join(dotNetDouble(x) for x in f[2:])) for f in fields))
+
+# Writes the "i j score" table of ZNMI.exe
+def writeScores(out, znmiValues):
+	rows, cols = np.nonzero(np.triu(~np.isnan(znmiValues), 1))
+	out.write("i\tj\tscore\n")
+	fastaIO.writeBlocks(out, ("%d\t%d\t%s\n" % (r, c, dotNetDouble(z)) for r, c, z in zip(rows.tolist(), cols.tolist(), znmiValues[rows, cols].tolist())))
+
+# Every score of an encoded alignment, as (znmi, nmi, e, je, gapPct); used
+#  in-process (e.g. on subsets from generateSubsets.py) without any files
+def scoreAlignment(aln, blockSize=64, minEntropy=MIN_ENTROPY, maxGap=MAX_GAPS):
+	codes, nSymbols = residueCodes(aln)
+	e = entropy(codes, nSymbols)
+	je = jointEntropy(codes, nSymbols, blockSize)
+	gapPct = gapFractions(aln)
+
+	znmiValues, nmiValues = znmi(e, je, gapPct, minEntropy, maxGap)
+	return znmiValues, nmiValues, e, je, gapPct
+
+def parseArgs():
+	parser = argparse.ArgumentParser(description="Mutual information (MI, NMI, ZNMI) between all pairs of alignment columns")
+	parser.add_argument("msaPath", help="Alignment in FASTA format (Fodor format with --fodor)")
+	parser.add_argument("--fodor", action="store_true", help="Read the alignment in Fodor format")
+	parser.add_argument("--block-size", type=int, default=64, help="Columns per block of the joint count products; bounds memory (default: 64)")
+	parser.add_argument("--min-entropy", type=float, default=MIN_ENTROPY, help="Columns with lower entropy are not scored (default: %s)" % MIN_ENTROPY)
+	parser.add_argument("--max-gaps", type=float, default=MAX_GAPS, help="Columns with this gap fraction or more are not scored (default: %s)" % MAX_GAPS)
+	parser.add_argument("--scores", action="store_true", help="Write only the \"i j score\" ZNMI table, as ZNMI.exe does")
+	args = parser.parse_args()
+	if args.block_size < 1:
+		parser.error("--block-size must be positive")
+	return args
+
+def main():
+	args = parseArgs()
+
+	with open(args.msaPath) as f:
+		records = fastaIO.readFodor(f) if args.fodor else fastaIO.readFasta(f)
+		aln = encodeAlignment([ seq for name, seq in records ])
+
+	znmiValues, nmiValues, e, je, gapPct = scoreAlignment(aln, args.block_size, args.min_entropy, args.max_gaps)
+
+	if args.scores:
+		writeScores(sys.stdout, znmiValues)
+	else:
+		writeXYZ(sys.stdout, znmiValues, nmiValues, e, je, gapPct)
+
+if __name__ == '__main__':
+	main()